@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks for the engine's hot paths.
+
+Each module is runnable on its own, e.g. ``python -m benchmarks.bench_layout``.
+"""
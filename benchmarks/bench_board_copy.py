@@ -0,0 +1,66 @@
+"""
+Measures the per-node cost of copying a BoardState for search: deep-copying the
+state together with a private copy of its layout geometry (what every node used
+to carry), versus BoardState.copy() sharing one immutable Layout.
+
+Sharing the layout mostly saves time. The memory each copy retains is dominated
+by its own per-node state (coin map, occupancy, region index, destination
+counters), so that ratio stays well below the time ratio.
+"""
+
+import copy
+import tracemalloc
+from   typing                   import Callable
+
+from   benchmarks.common        import format_row, measure
+from   board                    import Coin, get_layout
+from   state                    import BoardState
+
+COPIES = 200
+
+
+def private_layout_copy(board_state: BoardState) -> tuple:
+    """Copies the coin placement plus the layout's geometry tables per node."""
+    geometry = {
+        name: value
+        for name, value in vars(board_state.board).items()
+        if name != "topology"
+    }
+    return copy.deepcopy(geometry), copy.deepcopy(board_state.point_coin_map)
+
+
+def bytes_per_copy(make_copy: Callable[[], object]) -> float:
+    """Average memory retained by one copy, measured with tracemalloc."""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    copies = [make_copy() for _ in range(COPIES)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del copies
+    return (current - baseline) / COPIES
+
+
+def main() -> None:
+    header = f"{'per node':<28} {'private layout':>15} {'shared layout':>15}"
+    print(f"{header} {'ratio':>10}")
+    for side_count in (4, 6, 8):
+        layout = get_layout(side_count)
+        coins = [
+            Coin(point, region) for point in layout if (region := layout.region(point))
+        ]
+        board_state = BoardState(layout, coins)
+
+        before = measure(lambda: private_layout_copy(board_state))
+        after = measure(board_state.copy)
+        print(format_row(f"{side_count}-sided copy time", before, after))
+
+        before_bytes = bytes_per_copy(lambda: private_layout_copy(board_state))
+        after_bytes = bytes_per_copy(board_state.copy)
+        print(
+            f"{f'{side_count}-sided copy memory':<28} {before_bytes / 1024:>12.1f} KB "
+            f"{after_bytes / 1024:>12.1f} KB {before_bytes / after_bytes:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Times leaf evaluation on full multi-color boards: the original per-coin walk
+(GameStateWrapper.full_evaluate), the IncrementalEvaluator and, when NumPy is
+installed, the VectorizedEvaluator. Each leaf is reached by one move from a
+mid-game position, as in a search, with the move cache starting empty.
+"""
+
+import random
+from   typing                   import Callable
+
+from   benchmarks.common        import format_row, measure
+from   board                    import Coin, get_layout
+from   player                   import GreedyPlayer
+from   player.minmax.state      import GameStateWrapper
+from   player.minmax.vectorized import VectorizedEvaluator, np
+from   state                    import BoardState, GameState
+
+WARMUP_MOVES = 30
+
+
+def mid_game(side_count: int, region_map: dict[int, list[int]]) -> GameStateWrapper:
+    layout = get_layout(side_count)
+    coins = [
+        Coin(point, region) for point in layout if (region := layout.region(point))
+    ]
+    players = [GreedyPlayer(player_id) for player_id in region_map]
+    game = GameState(BoardState(layout, coins), players, region_map)
+    wrapper = GameStateWrapper(game, players[0])
+    rng = random.Random(0)
+    for _ in range(WARMUP_MOVES):
+        wrapper = wrapper.apply_move(rng.choice(wrapper.get_legal_moves()[:5]))
+    return wrapper
+
+
+def leaves(
+    wrapper: GameStateWrapper, evaluate: Callable[[], object]
+) -> Callable[[], None]:
+    moves = wrapper.get_legal_moves()
+
+    def run() -> None:
+        # Searched leaves are new positions: start with nothing memoised.
+        wrapper.move_cache.clear()
+        for move in moves:
+            wrapper.make_move(move)
+            evaluate()
+            wrapper.unmake_move()
+
+    return run
+
+
+def main() -> None:
+    print(f"{'leaves':<28} {'full walk':>15} {'evaluator':>15} {'speedup':>10}")
+    for label, side_count, region_map in (
+        ("6 players", 6, {i: [i + 1] for i in range(6)}),
+        ("2 players x 3 colors", 6, {0: [1, 3, 5], 1: [2, 4, 6]}),
+        ("8 players", 8, {i: [i + 1] for i in range(8)}),
+    ):
+        wrapper = mid_game(side_count, region_map)
+        before = measure(leaves(wrapper, wrapper.full_evaluate))
+        after = measure(leaves(wrapper, wrapper.evaluate))
+        print(format_row(f"{label} incremental", before, after))
+        if np is None:
+            print(f"{f'{label} vectorized':<28} skipped (NumPy is not installed)")
+            continue
+        vectorized = VectorizedEvaluator(
+            wrapper.game.board_state, region_map[wrapper.player.player_id]
+        )
+        after = measure(leaves(wrapper, vectorized.score))
+        print(format_row(f"{label} vectorized", before, after))
+
+
+if __name__ == "__main__":
+    main()
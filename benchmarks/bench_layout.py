@@ -0,0 +1,82 @@
+"""
+Compares Layout membership/region queries against recomputing the geometry on
+every call, which is what Layout did before its geometry was precomputed.
+"""
+
+from   typing                   import Optional
+
+from   benchmarks.common        import format_row, measure
+from   board.layout             import Layout
+from   geometry                 import Point
+from   geometry.utils           import point_enclosed_by
+
+
+def recomputed_contains(layout: Layout, point: Point) -> bool:
+    """Membership test that rebuilds the outer polygon and corners on every call."""
+    outer_polygon = layout._build_outer_polygon()
+    x_corners, y_corners = zip(*layout._build_corners(outer_polygon))
+    if (point.x + point.y) & 1:
+        return False
+    if not (
+        min(x_corners) <= point.x <= max(x_corners)
+        and min(y_corners) <= point.y <= max(y_corners)
+    ):
+        return False
+    if all(line.is_origin_side(point) for line in layout.central_polygon):
+        return True
+    return any(
+        point_enclosed_by(point, line, line_pair)
+        for line, line_pair in zip(layout.central_polygon, outer_polygon)
+    )
+
+
+def recomputed_region(layout: Layout, point: Point) -> Optional[int]:
+    """Region lookup that rebuilds the outer polygon and corners on every call."""
+    outer_polygon = layout._build_outer_polygon()
+    x_corners, y_corners = zip(*layout._build_corners(outer_polygon))
+    if (point.x + point.y) & 1:
+        return None
+    if not (
+        min(x_corners) <= point.x <= max(x_corners)
+        and min(y_corners) <= point.y <= max(y_corners)
+    ):
+        return None
+    if all(line.is_origin_side(point) for line in layout.central_polygon):
+        return 0
+    for idx, (line, line_pair) in enumerate(
+        zip(layout.central_polygon, outer_polygon), start=1
+    ):
+        if point_enclosed_by(point, line, line_pair):
+            return idx
+    return None
+
+
+def main() -> None:
+    print(f"{'query':<28} {'recomputed':>15} {'precomputed':>15} {'speedup':>10}")
+    for side_count in (4, 6, 8):
+        layout = Layout(side_count)
+        x_min, x_max = layout.x_bounds
+        y_min, y_max = layout.y_bounds
+        probes = [
+            Point(x, y)
+            for x in range(x_min - 1, x_max + 2)
+            for y in range(y_min - 1, y_max + 2)
+        ]
+        assert [recomputed_region(layout, p) for p in probes] == [
+            layout.region(p) for p in probes
+        ]
+        assert [recomputed_contains(layout, p) for p in probes] == [
+            p in layout for p in probes
+        ]
+
+        before = measure(lambda: [recomputed_region(layout, p) for p in probes])
+        after = measure(lambda: [layout.region(p) for p in probes])
+        print(format_row(f"{side_count}-sided region() x{len(probes)}", before, after))
+
+        before = measure(lambda: [recomputed_contains(layout, p) for p in probes])
+        after = measure(lambda: [p in layout for p in probes])
+        print(format_row(f"{side_count}-sided in x{len(probes)}", before, after))
+
+
+if __name__ == "__main__":
+    main()
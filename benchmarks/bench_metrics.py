@@ -0,0 +1,65 @@
+"""
+Compares DistanceMetrics queries computed from Point arithmetic on every call
+(and a fresh DistanceMetrics per query, as the evaluators used to build) with
+the per-layout precomputed distance/progress tables, and reports the memory the
+tables take for each board type.
+"""
+
+from   benchmarks.common        import format_row, measure
+from   board                    import Coin, get_layout
+from   board.layout             import LayoutInterface
+from   board.metrics            import DistanceMetrics
+from   geometry                 import Point
+
+
+class LegacyMetrics:
+    """DistanceMetrics before its tables were precomputed."""
+
+    def __init__(self, board: LayoutInterface) -> None:
+        self.board = board
+
+    @staticmethod
+    def distance(src: Point, dst: Point) -> int:
+        dx, dy = dst - src
+        dx, dy = abs(dx), abs(dy)
+        return dy + (dx - dy) // 2 if dx > dy else dy
+
+    def positive_distance(self, coin: Coin, dst: Point) -> int:
+        dx, dy = dst - coin.point
+        positive_x, positive_y = self.board.positive_direction(coin.region)
+        return dx * positive_x + dy * positive_y
+
+
+def queries(layout: LayoutInterface, metrics_for):
+    coins = [
+        Coin(point, region) for point in layout if (region := layout.region(point))
+    ]
+    targets = list(layout)[:: max(1, len(layout) // 16)]
+
+    def run() -> None:
+        for coin in coins:
+            metrics = metrics_for(layout)
+            for dst in targets:
+                metrics.positive_distance(coin, dst)
+                metrics.distance(coin.point, dst)
+
+    return run
+
+
+def main() -> None:
+    print(f"{'workload':<28} {'per call':>15} {'tables':>15} {'speedup':>10}")
+    for side_count in (4, 6, 8):
+        layout = get_layout(side_count)
+        before = measure(queries(layout, LegacyMetrics))
+        after = measure(queries(layout, lambda board: board.metrics))
+        print(format_row(f"{side_count}-sided metric queries", before, after))
+
+        build = measure(lambda: DistanceMetrics(layout), repeat=3)
+        print(
+            f"{f'{side_count}-sided tables':<28} {len(layout):>6} cells "
+            f"{layout.metrics.nbytes() / 1024:>9.1f} KB {build * 1e3:>9.1f} ms build"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compares the slotted, interned Point against the previous dict-backed Point on
+the dict/set-heavy workloads the engine runs: a Point-keyed jump search shaped
+like BoardState.valid_moves_helper, and layout membership probes.
+"""
+
+import random
+from   typing                   import Iterator
+
+from   benchmarks.common        import format_row, measure
+from   board                    import Layout
+from   geometry                 import Point
+
+
+class LegacyPoint:
+    """The Point implementation before it became a slotted flyweight."""
+
+    def __init__(self, x: int, y: int) -> None:
+        self._x, self._y = x, y
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    def __iter__(self) -> Iterator[int]:
+        return iter((self.x, self.y))
+
+    def __add__(self, other) -> "LegacyPoint":
+        return LegacyPoint(self.x + other.x, self.y + other.y)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LegacyPoint) and tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+
+def reachable(origin, occupied: set, on_board: set, directions: list) -> dict:
+    """Point-keyed jump-chain search in the style of valid_moves_helper."""
+    parent = {}
+    stack, visited = [origin], {origin}
+    while stack:
+        cur = stack.pop()
+        for delta in directions:
+            step = cur + delta
+            if step not in occupied:
+                continue
+            jump = step + delta
+            if jump in on_board and jump not in occupied and jump not in visited:
+                visited.add(jump)
+                parent[jump] = cur
+                stack.append(jump)
+    for delta in directions:
+        step = origin + delta
+        if step in on_board and step not in occupied:
+            parent[step] = origin
+    return parent
+
+
+def workload(point_type, layout: Layout, coins: list[tuple[int, int]]):
+    on_board = {point_type(x, y) for x, y in layout}
+    occupied = {point_type(x, y) for x, y in coins}
+    directions = [point_type(x, y) for x, y in layout.directions]
+    origins = list(occupied)
+
+    def run() -> None:
+        for origin in origins:
+            reachable(origin, occupied, on_board, directions)
+
+    return run
+
+
+def probe(point_type, points: list[tuple[int, int]]):
+    on_board = {point_type(x, y) for x, y in points}
+
+    def run() -> None:
+        for x, y in points:
+            assert point_type(x, y) in on_board
+
+    return run
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'workload':<28} {'legacy':>15} {'flyweight':>15} {'speedup':>10}")
+    for side_count in (4, 6, 8):
+        layout = Layout(side_count)
+        points = [tuple(point) for point in layout]
+        coins = rng.sample(points, len(points) // 3)
+
+        before = measure(workload(LegacyPoint, layout, coins))
+        after = measure(workload(Point, layout, coins))
+        print(format_row(f"{side_count}-sided jump search", before, after))
+
+        before = measure(probe(LegacyPoint, points))
+        after = measure(probe(Point, points))
+        print(format_row(f"{side_count}-sided build+probe", before, after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Per-coin cost of move generation: the previous jump DFS, which expanded each
+cell twice (on push and on pop) and re-derived entry rules in a separate filter
+pass, versus the single-pass BoardState.reachable.
+"""
+
+import random
+
+from   benchmarks.common        import format_row, measure
+from   board                    import Coin, get_layout
+from   state                    import BoardState
+from   state.tests.legacy_reachability \
+                                import legacy_valid_moves
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'per coin':<28} {'dfs':>15} {'bfs':>15} {'speedup':>10}")
+    for side_count in (4, 6, 8):
+        layout = get_layout(side_count)
+        for density in (4, 2):
+            points = list(layout)
+            coins = [
+                Coin(point, rng.randint(1, side_count))
+                for point in rng.sample(points, len(points) // density)
+            ]
+            board_state = BoardState(layout, coins)
+            before = measure(
+                lambda: [legacy_valid_moves(board_state, coin) for coin in coins]
+            )
+            after = measure(lambda: [board_state.reachable(coin) for coin in coins])
+            label = f"{side_count}-sided, 1/{density} full"
+            print(format_row(label, before / len(coins), after / len(coins)))
+
+
+if __name__ == "__main__":
+    main()
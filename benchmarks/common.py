@@ -0,0 +1,22 @@
+import timeit
+from   typing                   import Callable
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, number: int = 0) -> float:
+    """
+    Returns the best observed time (in seconds) of a single call to `fn`.
+    When `number` is 0, the loop count is picked automatically by timeit.
+    """
+    timer = timeit.Timer(fn)
+    if not number:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def format_row(label: str, before: float, after: float) -> str:
+    """Formats a before/after timing pair with the resulting speedup."""
+    speedup = before / after if after else float("inf")
+    return (
+        f"{label:<28} {before * 1e6:>12.2f} us {after * 1e6:>12.2f} us "
+        f"{speedup:>9.1f}x"
+    )
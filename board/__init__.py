@@ -1,4 +1,4 @@
 from   .coin                    import Coin
-from   .layout                  import Layout
+from   .layout                  import Layout, get_layout
 
-__all__ = ["Coin", "Layout"]
+__all__ = ["Coin", "Layout", "get_layout"]
@@ -7,26 +7,57 @@ class Coin:
     """
     Represents a single coin on the board.
 
+    Coins are immutable, slotted values with a cached hash, so they are cheap to
+    use as dict/set keys and safe to share between board states.
+
     Attributes:
         point (Point): The position of the coin.
         region (int): The region the coin belongs to (equivalent to color).
     """
 
+    __slots__ = ("point", "region", "_hash")
+
+    point: Point
+    region: int
+    _hash: int
+
     def __init__(self, point: Point, region: int) -> None:
         assert (
             region != 0
         ), "Coin's region starts from 1; 0 denotes common area that doesn't belong to any player"
-        self.point = point
-        self.region = region
+        object.__setattr__(self, "point", point)
+        object.__setattr__(self, "region", region)
+        object.__setattr__(self, "_hash", hash((point, region)))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __iter__(self) -> Iterator[Point | int]:
         return iter((self.point, self.region))
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, Coin) and tuple(self) == tuple(other)
+        if self is other:
+            return True
+        return (
+            isinstance(other, Coin)
+            and self.region == other.region
+            and self.point == other.point
+        )
 
     def __hash__(self) -> int:
-        return hash((self.point, self.region))
+        return self._hash
+
+    def __reduce__(self):
+        return Coin, (self.point, self.region)
+
+    def __copy__(self) -> "Coin":
+        return self
+
+    def __deepcopy__(self, memo) -> "Coin":
+        return self
 
     def __str__(self) -> str:
         return f"Coin(point={self.point}, region={self.region})"
@@ -1,7 +1,11 @@
 from   abc                      import ABC, abstractmethod
-from   typing                   import Iterable, Iterator, Optional
+import functools
+from   types                    import MappingProxyType
+from   typing                   import Iterable, Iterator, Mapping, Optional
 
 from   board                    import Coin, constants
+from   board.metrics            import DistanceMetrics
+from   board.topology           import Topology
 from   geometry                 import Line, Point
 from   geometry.utils           import (get_line_intersection,
                                         get_trapping_lines, point_enclosed_by)
@@ -90,11 +94,29 @@ class LayoutInterface(ABC):
         """
         pass
 
+    @functools.cached_property
+    def topology(self) -> Topology:
+        """
+        Integer-indexed cell graph of this layout (neighbours, jumps and entry rules),
+        compiled on first use.
+        """
+        return Topology(self)
+
+    @functools.cached_property
+    def metrics(self) -> DistanceMetrics:
+        """Distance and progress tables of this layout, precomputed on first use."""
+        return DistanceMetrics(self)
+
 
 class Layout(LayoutInterface):
     """
     Concrete implementation of LayoutInterface for a polygonal Chinese Checkers board.
     Handles region detection, movement validation, and geometric bounds.
+
+    All geometry (outer polygon, corners, bounds, points and their regions) is
+    computed once at construction, so membership and region queries are lookups.
+    Layouts are immutable once built; use `get_layout` to share a single instance
+    per side count across all board states.
     """
 
     def __init__(self, side_count: int) -> None:
@@ -102,6 +124,30 @@ class Layout(LayoutInterface):
         super().__init__(side_count)
         central_polygon = constants.REGION_POLYGON_MAP[side_count]
         self.central_polygon = central_polygon
+        self._outer_polygon = self._build_outer_polygon()
+        self._corners = self._build_corners(self._outer_polygon)
+        x_corners, y_corners = zip(*self._corners)
+        self._x_bounds = (min(x_corners), max(x_corners))
+        self._y_bounds = (min(y_corners), max(y_corners))
+        self._region_map: dict[Point, int] = {}
+        for x in range(self._x_bounds[0], self._x_bounds[1] + 1):
+            for y in range(self._y_bounds[0], self._y_bounds[1] + 1):
+                point = Point(x, y)
+                if (region := self._locate(point)) is not None:
+                    self._region_map[point] = region
+        self._points = tuple(self._region_map)
+        self._frozen = True
+
+    def __setattr__(self, name, value) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        super().__setattr__(name, value)
+
+    def __copy__(self) -> "Layout":
+        return self
+
+    def __deepcopy__(self, memo) -> "Layout":
+        return self
 
     @property
     def directions(self) -> Iterable[Point]:
@@ -113,10 +159,9 @@ class Layout(LayoutInterface):
         a, b, c = self.central_polygon[region - 1]
         return Point(-a * sign(c), -b * sign(c))
 
-    @property
-    def outer_polygon(self) -> list[list[Line]]:
+    def _build_outer_polygon(self) -> tuple[tuple[Line, Line], ...]:
         """Constructs outer bounding line pairs that form each region's wedge."""
-        bounding_line_pairs: list[list[Line]] = []
+        bounding_line_pairs: list[tuple[Line, Line]] = []
         prev, cur, nxt = -1, 0, 1
         while cur < self.n:
 
@@ -133,75 +178,85 @@ class Layout(LayoutInterface):
                 p1, p2 = map(int, p1), map(int, p2)
                 p1, p2 = Point(*p1), Point(*p2)
                 l1, l2 = get_trapping_lines(p1, p2)
-                bounding_line_pairs.append([l1, l2])
+                bounding_line_pairs.append((l1, l2))
             prev = (prev + 1) % self.n
             cur = cur + 1
             nxt = (nxt + 1) % self.n
-        return bounding_line_pairs
+        return tuple(bounding_line_pairs)
 
-    @property
-    def corners(self) -> list[Point]:
-        """
-        Get outer polygon/wedge corners by intersecting outer lines.
-        """
+    @staticmethod
+    def _build_corners(
+        outer_polygon: Iterable[tuple[Line, Line]]
+    ) -> tuple[Point, ...]:
+        """Get outer polygon/wedge corners by intersecting outer lines."""
         corners = [
             point
-            for l1, l2 in self.outer_polygon
+            for l1, l2 in outer_polygon
             if (point := get_line_intersection(l1, l2))
         ]
         assert all(tuple(map(int, point)) == tuple(point) for point in corners)
-        return [Point(*map(int, corner)) for corner in corners]
-
-    @property
-    def x_bounds(self) -> tuple[int, int]:
-        x_corners, _ = zip(*self.corners)
-        return min(x_corners), max(x_corners)
+        return tuple(Point(*map(int, corner)) for corner in corners)
 
-    @property
-    def y_bounds(self) -> tuple[int, int]:
-        _, y_corners = zip(*self.corners)
-        return min(y_corners), max(y_corners)
-
-    def __contains__(self, point: Point) -> bool:
-        """Determine if a point lies inside the layout."""
+    def _locate(self, point: Point) -> Optional[int]:
+        """
+        Geometrically classify a point: its region index [0–n], or None if it lies
+        outside the layout. Only used to build the region map.
+        """
         if (point.x + point.y) & 1:
-            return False
+            return None
         if not (
-            min(self.x_bounds) <= point.x <= max(self.x_bounds)
-            and min(self.y_bounds) <= point.y <= max(self.y_bounds)
+            self._x_bounds[0] <= point.x <= self._x_bounds[1]
+            and self._y_bounds[0] <= point.y <= self._y_bounds[1]
         ):
-            return False
+            return None
 
         if all(line.is_origin_side(point) for line in self.central_polygon):
-            return True
+            return 0
 
-        if any(
-            point_enclosed_by(point, line, line_pair)
-            for line, line_pair in zip(self.central_polygon, self.outer_polygon)
+        for idx, (line, line_pair) in enumerate(
+            zip(self.central_polygon, self._outer_polygon), start=1
         ):
-            return True
+            if point_enclosed_by(point, line, line_pair):
+                return idx
+        return None
+
+    @property
+    def outer_polygon(self) -> tuple[tuple[Line, Line], ...]:
+        """Outer bounding line pairs that form each region's wedge."""
+        return self._outer_polygon
+
+    @property
+    def corners(self) -> tuple[Point, ...]:
+        """Outer polygon/wedge corners of the layout."""
+        return self._corners
+
+    @property
+    def x_bounds(self) -> tuple[int, int]:
+        return self._x_bounds
+
+    @property
+    def y_bounds(self) -> tuple[int, int]:
+        return self._y_bounds
+
+    @property
+    def region_map(self) -> Mapping[Point, int]:
+        """Read-only mapping of every point on the layout to its region index."""
+        return MappingProxyType(self._region_map)
 
-        return False
+    def __contains__(self, point: Point) -> bool:
+        """Determine if a point lies inside the layout."""
+        return point in self._region_map
 
     def __iter__(self) -> Iterator[Point]:
         """Iterate through all points within the board layout."""
-        for x in range(min(self.x_bounds), max(self.x_bounds) + 1):
-            for y in range(min(self.y_bounds), max(self.y_bounds) + 1):
-                if Point(x, y) in self:
-                    yield Point(x, y)
+        return iter(self._points)
+
+    def __len__(self) -> int:
+        return len(self._points)
 
     def region(self, point: Point) -> Optional[int]:
         """Get the region index [0–n] a point lies in."""
-        if not point in self:
-            return None
-        for idx, (line, line_pair) in enumerate(
-            zip(self.central_polygon, self.outer_polygon), start=1
-        ):
-            if not line.is_origin_side(point) and point_enclosed_by(
-                point, line, line_pair
-            ):
-                return idx
-        return 0
+        return self._region_map.get(point)
 
     def can_enter(
         self, coin: Coin, point: Point, relax_region_restriction: bool = False
@@ -240,3 +295,9 @@ class Layout(LayoutInterface):
             and coin.point in self
             and self.can_enter(coin, coin.point)
         )
+
+
+@functools.lru_cache(maxsize=None)
+def get_layout(side_count: int) -> Layout:
+    """Returns the process-wide shared Layout for the given number of sides."""
+    return Layout(side_count)
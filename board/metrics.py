@@ -1,26 +1,124 @@
+from   array                    import array
+from   typing                   import TYPE_CHECKING
+
 from   board.coin               import Coin
-from   board.layout             import LayoutInterface
+from   board.topology           import OFF_BOARD, Topology
 from   geometry                 import Point
 
+if TYPE_CHECKING:
+    from board.layout import LayoutInterface
+
+# hops_to_goal value for cells that cannot reach the goal at all.
+UNREACHABLE = 255
+
 
 class DistanceMetrics:
     """
     Provides distance and heuristic calculations for coins on a Chinese Checkers board.
+
+    Distances between all pairs of cells are precomputed into a flat byte array
+    (cell x cell), and the progress of every cell along each region's positive
+    direction into one signed byte array per region, so every query is an
+    indexed lookup. Building the tables costs O(cells^2); use `layout.metrics`
+    to share one instance per layout instead of constructing it per query.
+
+    `hops_to_goal[region][cell]` is the fewest hops (steps or single jumps) from
+    the cell into the region's goal cells under the region's entry rules,
+    assuming every jump has a coin to jump over (UNREACHABLE if none). It is a
+    heuristic, not a bound on moves: one move may chain several jumps. Counting
+    whole chains as one move instead would be admissible but useless, as every
+    cell outside the goal is then a single relaxed chain away from it.
     """
 
-    def __init__(self, board: LayoutInterface) -> None:
+    def __init__(self, board: "LayoutInterface") -> None:
         self.board = board
+        self.topology = topology = board.topology
+        self.size = size = topology.size
+        # Board diameters and coordinates stay far below the byte limits; array()
+        # raises OverflowError should a layout ever outgrow them.
+        self.distances = array(
+            "B", (topology.distance(a, b) for a in range(size) for b in range(size))
+        )
+        self.progress: list[array] = [array("b")] * len(topology.opposite)
+        for region in topology.coin_regions:
+            dx, dy = board.positive_direction(region)
+            self.progress[region] = array(
+                "b", (x * dx + y * dy for x, y in topology.points)
+            )
+        self.hops_to_goal: list[array] = [array("B")] * len(topology.opposite)
+        for region in topology.coin_regions:
+            self.hops_to_goal[region] = self._goal_hops(topology, region)
 
     @staticmethod
-    def distance(src: Point, dst: Point) -> int:
-        """Computes the hexagonal grid distance between two points."""
+    def _goal_hops(topology: Topology, region: int) -> array:
+        """Multi-source BFS from the region's goal cells over reversed hops."""
+        step_entry = topology.step_entry[region]
+        jump_entry = topology.jump_entry[region]
+        predecessors: list[list[int]] = [[] for _ in range(topology.size)]
+        for cell in range(topology.size):
+            for neighbor, (_, landing) in zip(
+                topology.neighbors[cell], topology.jumps[cell]
+            ):
+                if neighbor != OFF_BOARD and step_entry[neighbor]:
+                    predecessors[neighbor].append(cell)
+                if landing != OFF_BOARD and jump_entry[landing]:
+                    predecessors[landing].append(cell)
+
+        hops = array("B", [UNREACHABLE] * topology.size)
+        frontier = list(topology.goal_cells[region])
+        for cell in frontier:
+            hops[cell] = 0
+        while frontier:
+            next_frontier = []
+            for cell in frontier:
+                for previous in predecessors[cell]:
+                    if hops[previous] == UNREACHABLE:
+                        hops[previous] = hops[cell] + 1
+                        next_frontier.append(previous)
+            frontier = next_frontier
+        return hops
+
+    @staticmethod
+    def hex_distance(src: Point, dst: Point) -> int:
+        """Computes the hexagonal grid distance between two arbitrary points."""
         dx, dy = dst - src
         dx, dy = abs(dx), abs(dy)
         return dy + (dx - dy) // 2 if dx > dy else dy
 
+    def cell_distance(self, src: int, dst: int) -> int:
+        """Looks up the hexagonal grid distance between two cells."""
+        return self.distances[src * self.size + dst]
+
+    def distance(self, src: Point, dst: Point) -> int:
+        """Computes the hexagonal grid distance between two points."""
+        index = self.topology.index
+        src_cell, dst_cell = index.get(src, OFF_BOARD), index.get(dst, OFF_BOARD)
+        if src_cell == OFF_BOARD or dst_cell == OFF_BOARD:
+            return self.hex_distance(src, dst)
+        return self.distances[src_cell * self.size + dst_cell]
+
+    def cell_progress(self, region: int, src: int, dst: int) -> int:
+        """Signed progress of a move between two cells along the region's direction."""
+        progress = self.progress[region]
+        return progress[dst] - progress[src]
+
+    def cell_hops_to_goal(self, region: int, cell: int) -> int:
+        """Hop count from a cell into the region's goal cells."""
+        return self.hops_to_goal[region][cell]
+
     def positive_distance(self, coin: Coin, dst: Point) -> int:
         """Computes the signed distance in the 'positive' direction for a coin's region."""
-        src = coin.point
-        dx, dy = dst - src
-        positive_x, positive_y = self.board.positive_direction(coin.region)
-        return dx * positive_x + dy * positive_y
+        index = self.topology.index
+        src_cell = index.get(coin.point, OFF_BOARD)
+        dst_cell = index.get(dst, OFF_BOARD)
+        if src_cell == OFF_BOARD or dst_cell == OFF_BOARD:
+            dx, dy = dst - coin.point
+            positive_x, positive_y = self.board.positive_direction(coin.region)
+            return dx * positive_x + dy * positive_y
+        progress = self.progress[coin.region]
+        return progress[dst_cell] - progress[src_cell]
+
+    def nbytes(self) -> int:
+        """Memory held by the precomputed tables' buffers, in bytes."""
+        tables = [self.distances, *self.progress, *self.hops_to_goal]
+        return sum(len(table) * table.itemsize for table in tables)
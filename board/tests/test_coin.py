@@ -0,0 +1,34 @@
+import copy
+
+import pytest
+
+from   board.coin               import Coin
+from   geometry                 import Point
+
+
+def test_coin_equality_and_hash():
+    a, b = Coin(Point(2, 6), 1), Coin(Point(2, 6), 1)
+    assert a == b and hash(a) == hash(b)
+    assert a != Coin(Point(2, 6), 2)
+    assert a != Coin(Point(4, 6), 1)
+    assert len({a, b}) == 1
+
+
+def test_coin_is_immutable():
+    coin = Coin(Point(2, 6), 1)
+    assert not hasattr(coin, "__dict__")
+    with pytest.raises(AttributeError):
+        coin.region = 2  # type: ignore
+    with pytest.raises(AttributeError):
+        coin.point = Point(0, 0)  # type: ignore
+
+
+def test_coin_copies_are_shared():
+    coin = Coin(Point(2, 6), 1)
+    assert copy.copy(coin) is coin
+    assert copy.deepcopy(coin) is coin
+
+
+def test_coin_unpacking():
+    point, region = Coin(Point(2, 6), 3)
+    assert point == Point(2, 6) and region == 3
@@ -1,7 +1,9 @@
+import copy
+
 import pytest
 
 from   board.coin               import Coin
-from   board.layout             import Layout
+from   board.layout             import Layout, get_layout
 from   geometry                 import Point
 
 
@@ -119,3 +121,34 @@ def test_all_regions_unique_and_covered():
         if r is not None:
             regions.add(r)
     assert regions == set(range(0, 7))
+
+
+@pytest.mark.parametrize("side_count", [4, 6, 8])
+def test_precomputed_geometry_is_immutable(side_count):
+    layout = Layout(side_count)
+    assert isinstance(layout.corners, tuple)
+    assert isinstance(layout.outer_polygon, tuple)
+    with pytest.raises(TypeError):
+        layout.region_map[Point(0, 0)] = 1  # type: ignore
+
+
+@pytest.mark.parametrize("side_count", [4, 6, 8])
+def test_region_map_matches_iteration(side_count):
+    layout = Layout(side_count)
+    assert list(layout.region_map) == list(layout)
+    assert len(layout) == len(layout.region_map)
+    for point, region in layout.region_map.items():
+        assert layout.region(point) == region
+
+
+def test_get_layout_is_shared_per_side_count():
+    assert get_layout(6) is get_layout(6)
+    assert get_layout(6) is not get_layout(4)
+    assert list(get_layout(8)) == list(Layout(8))
+
+
+def test_layout_is_immutable():
+    layout = Layout(6)
+    with pytest.raises(AttributeError):
+        layout.n = 4
+    assert copy.deepcopy(layout) is layout
@@ -0,0 +1,75 @@
+import pytest
+
+from   board                    import Coin, get_layout
+from   board.metrics            import DistanceMetrics
+from   geometry                 import Point
+
+
+@pytest.mark.parametrize("side_count", [4, 6, 8])
+def test_tables_match_direct_formulas(side_count):
+    layout = get_layout(side_count)
+    metrics = layout.metrics
+    points = list(layout)
+    for src in points:
+        for dst in points:
+            assert metrics.distance(src, dst) == DistanceMetrics.hex_distance(src, dst)
+    for region in layout.topology.coin_regions:
+        positive_x, positive_y = layout.positive_direction(region)
+        src = points[0]
+        for dst in points:
+            dx, dy = dst - src
+            expected = dx * positive_x + dy * positive_y
+            assert metrics.positive_distance(Coin(src, region), dst) == expected
+
+
+def test_metrics_are_shared_per_layout():
+    layout = get_layout(6)
+    assert layout.metrics is get_layout(6).metrics
+    assert layout.metrics.nbytes() >= len(layout) ** 2
+
+
+def test_distance_off_board_falls_back_to_formula():
+    metrics = get_layout(6).metrics
+    far = Point(1000, 0)
+    assert metrics.distance(Point(0, 0), far) == 500
+    topology = metrics.topology
+    a, b = topology.cell_of(Point(0, 0)), topology.cell_of(Point(4, 0))
+    assert metrics.cell_distance(a, b) == 2
+    assert metrics.cell_progress(1, a, b) == -metrics.cell_progress(1, b, a)
+
+
+def test_positive_distance_off_board_falls_back_to_formula():
+    layout = get_layout(6)
+    metrics = layout.metrics
+    src, far = Point(0, 0), Point(1000, 2)
+    for region in layout.topology.coin_regions:
+        positive_x, positive_y = layout.positive_direction(region)
+        expected = 1000 * positive_x + 2 * positive_y
+        assert metrics.positive_distance(Coin(src, region), far) == expected
+        assert metrics.positive_distance(Coin(far, region), src) == -expected
+
+
+@pytest.mark.parametrize("side_count", [4, 6, 8])
+def test_hops_to_goal_is_a_relaxed_hop_distance(side_count):
+    layout = get_layout(side_count)
+    metrics, topology = layout.metrics, layout.topology
+    for region in topology.coin_regions:
+        hops = metrics.hops_to_goal[region]
+        goals = set(topology.goal_cells[region])
+        for cell in range(topology.size):
+            successors = [
+                n
+                for n in topology.neighbors[cell]
+                if n >= 0 and topology.step_entry[region][n]
+            ] + [
+                landing
+                for _, landing in topology.jumps[cell]
+                if landing >= 0 and topology.jump_entry[region][landing]
+            ]
+            if cell in goals:
+                assert hops[cell] == 0
+            else:
+                assert hops[cell] == 1 + min(hops[n] for n in successors)
+            # Jumps make the bound at most the plain distance to the nearest goal.
+            nearest = min(metrics.cell_distance(cell, goal) for goal in goals)
+            assert hops[cell] <= nearest
@@ -0,0 +1,71 @@
+import pytest
+
+from   board.layout             import Layout
+from   board.topology           import OFF_BOARD
+from   geometry                 import Point
+
+
+@pytest.mark.parametrize("side_count", [4, 6, 8])
+def test_cells_are_dense_and_ordered(side_count):
+    layout = Layout(side_count)
+    topology = layout.topology
+    assert list(topology.points) == list(layout)
+    assert [topology.index[p] for p in layout] == list(range(len(layout)))
+
+
+@pytest.mark.parametrize("side_count", [4, 6, 8])
+def test_neighbor_and_jump_tables(side_count):
+    layout = Layout(side_count)
+    topology = layout.topology
+    for cell, point in enumerate(topology.points):
+        for d, delta in enumerate(topology.directions):
+            step = point + delta
+            over, landing = topology.jumps[cell][d]
+            assert topology.neighbors[cell][d] == over
+            assert over == (topology.index[step] if step in layout else OFF_BOARD)
+            jump = step + delta
+            expected = topology.index[jump] if jump in layout else OFF_BOARD
+            assert landing == (OFF_BOARD if over == OFF_BOARD else expected)
+
+
+def test_regions_and_entry_rules_match_layout():
+    layout = Layout(6)
+    topology = layout.topology
+    assert topology.coin_regions == (1, 2, 3, 4, 5, 6)
+    for cell, point in enumerate(topology.points):
+        assert topology.regions[cell] == layout.region(point)
+    # Region 1 may step into the centre and its own/opposite wedge only.
+    allowed = {0, 1, layout.opposite_region(1)}
+    for cell, ok in enumerate(topology.step_entry[1]):
+        assert ok == (topology.regions[cell] in allowed)
+    assert all(topology.jump_entry[1])
+
+
+def test_cell_of_and_distance():
+    topology = Layout(6).topology
+    assert topology.cell_of(Point(1000, 0)) == OFF_BOARD
+    origin = topology.cell_of(Point(0, 0))
+    assert topology.distance(origin, topology.cell_of(Point(4, 0))) == 2
+    assert topology.distance(origin, topology.cell_of(Point(2, 2))) == 2
+
+
+@pytest.mark.parametrize("side_count", [4, 6, 8])
+def test_corner_and_goal_tables(side_count):
+    layout = Layout(side_count)
+    topology = layout.topology
+    for region in topology.coin_regions:
+        source = topology.points[topology.source_corner[region]]
+        destination = topology.points[topology.destination_corner[region]]
+        assert source in layout.corners and layout.region(source) == region
+        assert destination in layout.corners
+        assert layout.region(destination) == layout.opposite_region(region)
+
+        goals = topology.goal_cells[region]
+        expected = {cell for cell, ok in enumerate(topology.goal_mask[region]) if ok}
+        assert set(goals) == expected and len(goals) == len(expected)
+        assert goals[0] == topology.destination_corner[region]
+        depths = [
+            topology.distance(cell, topology.destination_corner[region])
+            for cell in goals
+        ]
+        assert depths == sorted(depths)
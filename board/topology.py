@@ -0,0 +1,139 @@
+import random
+from   typing                   import Optional, TYPE_CHECKING
+
+from   board.coin               import Coin
+from   geometry                 import Point
+
+if TYPE_CHECKING:
+    from board.layout import LayoutInterface
+
+# Sentinel cell id for neighbours/landings that fall off the board.
+OFF_BOARD = -1
+# Fixed seed so Zobrist keys (and hence position hashes) are reproducible.
+ZOBRIST_SEED = 0x5EED
+
+
+class Topology:
+    """
+    Compiled, integer-indexed view of a board layout.
+
+    Every point on the layout gets a dense cell id in iteration order. Per cell,
+    the neighbour reached in each direction and the (over, landing) pair of the
+    jump in that direction are stored once, with OFF_BOARD (-1) for targets that
+    leave the board, so move generation never builds or hashes Point objects.
+
+    Attributes:
+        points (tuple[Point, ...]): Cell id -> point.
+        index (dict[Point, int]): Point -> cell id.
+        regions (tuple[int, ...]): Cell id -> region index.
+        neighbors (tuple[tuple[int, ...], ...]): neighbors[cell][direction] -> cell id.
+        jumps (tuple[tuple[tuple[int, int], ...], ...]): jumps[cell][direction] ->
+            (over, landing) cell ids.
+        step_entry / jump_entry (list[tuple[bool, ...]]): [region][cell] -> whether
+            a coin of that region may end a step / a jump on the cell.
+        opposite (list[Optional[int]]): region -> destination region.
+        goal_mask (list[tuple[bool, ...]]): [region][cell] -> whether the cell lies
+            in the region's destination region.
+        source_corner / destination_corner (list[int]): region -> cell id of the
+            outer corner of the region's home / destination wedge (OFF_BOARD if
+            the layout has none).
+        goal_cells (list[tuple[int, ...]]): region -> destination cells, deepest
+            (closest to the destination corner) first.
+        zobrist_keys (list[tuple[int, ...]]): [region][cell] -> 64-bit Zobrist key.
+        side_keys (tuple[int, ...]): player index -> 64-bit side-to-move key.
+    """
+
+    def __init__(self, layout: "LayoutInterface") -> None:
+        self.points: tuple[Point, ...] = tuple(layout)
+        self.index: dict[Point, int] = {
+            point: cell for cell, point in enumerate(self.points)
+        }
+        self.size = len(self.points)
+        self.regions: tuple[int, ...] = tuple(
+            layout.region(point) for point in self.points
+        )
+        self.directions: tuple[Point, ...] = tuple(layout.directions)
+
+        self.neighbors = tuple(
+            tuple(self.cell_of(point + delta) for delta in self.directions)
+            for point in self.points
+        )
+        # A jump needs a cell to jump over, so its landing is OFF_BOARD whenever
+        # the cell in between is.
+        self.jumps = tuple(
+            tuple(
+                (
+                    over,
+                    OFF_BOARD
+                    if over == OFF_BOARD
+                    else self.cell_of(point + delta + delta),
+                )
+                for over, delta in zip(neighbors, self.directions)
+            )
+            for point, neighbors in zip(self.points, self.neighbors)
+        )
+
+        self.coin_regions: tuple[int, ...] = tuple(
+            sorted({region for region in self.regions if region})
+        )
+        region_count = max(self.coin_regions, default=0) + 1
+        self.step_entry: list[tuple[bool, ...]] = [()] * region_count
+        self.jump_entry: list[tuple[bool, ...]] = [()] * region_count
+        self.opposite: list[Optional[int]] = [None] * region_count
+        self.goal_mask: list[tuple[bool, ...]] = [()] * region_count
+        self.source_corner: list[int] = [OFF_BOARD] * region_count
+        self.destination_corner: list[int] = [OFF_BOARD] * region_count
+        self.goal_cells: list[tuple[int, ...]] = [()] * region_count
+        corner_of: dict[int, int] = {}
+        for corner in layout.corners:
+            cell = self.cell_of(corner)
+            if cell != OFF_BOARD:
+                corner_of.setdefault(self.regions[cell], cell)
+        for region in self.coin_regions:
+            self.step_entry[region] = tuple(
+                bool(layout.can_enter(Coin(point, region), point))
+                for point in self.points
+            )
+            self.jump_entry[region] = tuple(
+                bool(layout.can_enter(Coin(point, region), point, True))
+                for point in self.points
+            )
+            self.opposite[region] = layout.opposite_region(region)
+            self.goal_mask[region] = tuple(
+                cell_region == self.opposite[region] for cell_region in self.regions
+            )
+            source = corner_of.get(region, OFF_BOARD)
+            destination = corner_of.get(self.opposite[region], OFF_BOARD)
+            self.source_corner[region] = source
+            self.destination_corner[region] = destination
+            goals = [cell for cell in range(self.size) if self.goal_mask[region][cell]]
+            if destination != OFF_BOARD:
+                goals.sort(key=lambda cell: (self.distance(cell, destination), cell))
+            self.goal_cells[region] = tuple(goals)
+
+        # Every player owns at least one region, so region_count side keys suffice.
+        rng = random.Random(ZOBRIST_SEED)
+        self.zobrist_keys: list[tuple[int, ...]] = [
+            tuple(rng.getrandbits(64) for _ in range(self.size))
+            for _ in range(region_count)
+        ]
+        self.side_keys: tuple[int, ...] = tuple(
+            rng.getrandbits(64) for _ in range(region_count)
+        )
+
+    def cell_of(self, point: Point) -> int:
+        """Returns the cell id of a point, or OFF_BOARD if it is not on the board."""
+        return self.index.get(point, OFF_BOARD)
+
+    def distance(self, src: int, dst: int) -> int:
+        """Computes the hexagonal grid distance between two cells."""
+        (sx, sy), (dx, dy) = self.points[src], self.points[dst]
+        dx, dy = abs(dx - sx), abs(dy - sy)
+        return dy + (dx - dy) // 2 if dx > dy else dy
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __deepcopy__(self, memo) -> "Topology":
+        # Compiled tables are never mutated, so copies can share them.
+        return self
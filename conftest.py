@@ -0,0 +1,23 @@
+import pytest
+
+from   board                    import Coin, get_layout
+from   player                   import GreedyPlayer
+from   state                    import BoardState, GameState
+
+
+@pytest.fixture
+def make_game_state():
+    """
+    Factory for games on a `side_count` board with every coin of the mapped
+    regions at home; by default two greedy players race between regions 1 and 4.
+    """
+
+    def make(side_count=6, region_map=None, players=None):
+        region_map = region_map or {0: [1], 1: [4]}
+        layout = get_layout(side_count)
+        regions = {r for rs in region_map.values() for r in rs}
+        coins = [Coin(p, r) for p in layout if (r := layout.region(p)) in regions]
+        players = players or [GreedyPlayer(player_id) for player_id in region_map]
+        return GameState(BoardState(layout, coins), players, region_map)
+
+    return make
@@ -1,6 +1,6 @@
 from   typing                   import Any, Sequence
 
-from   board                    import Coin, Layout
+from   board                    import Coin, get_layout
 from   player                   import HumanPlayer, MinMaxPlayer
 from   player.base              import Player
 from   render.board             import BaseBoardRenderer
@@ -52,7 +52,7 @@ class GameManager:
             players, regions_range_per_player, colors_per_player, total_colors
         )
         all_regions = sum(player_id_region_map.values(), [])
-        layout = Layout(side_count=total_colors)
+        layout = get_layout(total_colors)
         coins = [
             Coin(point, region)
             for point in layout
@@ -1,10 +1,21 @@
 from   typing                   import Iterator
 
+# Points with both coordinates within this bound are interned. It comfortably
+# covers every supported layout (plus a jump's reach beyond its edge) while
+# keeping the cache bounded for arbitrary inputs such as screen coordinates.
+INTERN_LIMIT = 32
+
 
 class Point:
     """
     Represents an immutable 2D point with integer coordinates.
 
+    Points are slotted flyweights: the hash is computed once, and integer points
+    near the origin (see INTERN_LIMIT) are interned so that `Point(x, y)` returns a
+    shared instance and equality usually short-circuits on identity. Points built
+    from other number types are never interned, so they cannot leak their
+    coordinate types into later integer lookups.
+
     Supports:
     - Iteration
     - Addition and subtraction with other Point objects
@@ -12,16 +23,38 @@ class Point:
     - String and representation formatting
     """
 
-    def __init__(self, x: int, y: int) -> None:
-        self._x, self._y = x, y
+    __slots__ = ("x", "y", "_hash")
+    _interned: dict[tuple[int, int], "Point"] = {}
+
+    x: int
+    y: int
+    _hash: int
+
+    def __new__(cls, x: int, y: int) -> "Point":
+        key = (x, y)
+        internable = (
+            type(x) is int
+            and type(y) is int
+            and -INTERN_LIMIT <= x <= INTERN_LIMIT
+            and -INTERN_LIMIT <= y <= INTERN_LIMIT
+        )
+        if internable:
+            point = cls._interned.get(key)
+            if point is not None:
+                return point
+        point = super().__new__(cls)
+        object.__setattr__(point, "x", x)
+        object.__setattr__(point, "y", y)
+        object.__setattr__(point, "_hash", hash(key))
+        if internable:
+            cls._interned[key] = point
+        return point
 
-    @property
-    def x(self) -> int:
-        return self._x
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-    @property
-    def y(self) -> int:
-        return self._y
+    def __delattr__(self, name) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __iter__(self) -> Iterator[int]:
         return iter((self.x, self.y))
@@ -33,10 +66,21 @@ class Point:
         return Point(self.x - other.x, self.y - other.y)
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, Point) and tuple(self) == tuple(other)
+        if self is other:
+            return True
+        return isinstance(other, Point) and self.x == other.x and self.y == other.y
 
     def __hash__(self) -> int:
-        return hash((self.x, self.y))
+        return self._hash
+
+    def __reduce__(self):
+        return Point, (self.x, self.y)
+
+    def __copy__(self) -> "Point":
+        return self
+
+    def __deepcopy__(self, memo) -> "Point":
+        return self
 
     def __str__(self) -> str:
         return f"Point(x={self.x}, y={self.y})"
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from   geometry                 import Point
@@ -42,3 +45,49 @@ def test_mutate_point():
     with pytest.raises(AttributeError):
         p = Point(3, 4)
         p.x = 10  # type: ignore
+
+
+def test_points_are_interned():
+    assert Point(3, 4) is Point(3, 4)
+    assert Point(1, 2) + Point(2, 2) is Point(3, 4)
+
+
+def test_far_points_are_equal_but_not_cached():
+    far = Point(10_000, 5)
+    assert far == Point(10_000, 5)
+    assert hash(far) == hash(Point(10_000, 5))
+    assert (10_000, 5) not in Point._interned
+
+
+def test_non_int_points_do_not_leak_into_interned_points(monkeypatch):
+    # A fresh cache, restored afterwards, so the non-int points come first.
+    monkeypatch.setattr(Point, "_interned", {})
+    floating = Point(3.0, 4.0)
+    boolean = Point(True, 0)
+
+    point = Point(3, 4)
+    assert point is not floating
+    assert type(point.x) is int and type(point.y) is int
+    assert str(point) == "Point(x=3, y=4)"
+    assert point == floating
+
+    point = Point(1, 0)
+    assert point is not boolean
+    assert type(point.x) is int
+    assert str(point) == "Point(x=1, y=0)"
+    assert all(type(x) is int and type(y) is int for x, y in Point._interned)
+
+
+def test_point_is_slotted():
+    p = Point(3, 4)
+    assert not hasattr(p, "__dict__")
+    with pytest.raises(AttributeError):
+        p.z = 1  # type: ignore
+
+
+def test_point_copy_and_pickle():
+    p = Point(3, 4)
+    assert copy.deepcopy(p) is p
+    assert pickle.loads(pickle.dumps(p)) is p
+    far = Point(500, 500)
+    assert pickle.loads(pickle.dumps(far)) == far
@@ -4,16 +4,25 @@ import time
 from   typing                   import Optional, TYPE_CHECKING
 
 from   board                    import Coin
-from   board.metrics            import DistanceMetrics
 from   geometry                 import Point
 from   player.base              import IOInterface, Player
+from   player.minmax.move_cache import MoveCache
+from   player.minmax.search     import (LMR_FULL_MOVES, LMR_MIN_DEPTH,
+                                        QUIESCENCE_PROGRESS, SearchContext,
+                                        SearchStats, SearchTimeout)
 from   player.minmax.state      import GameStateWrapper, MinMaxState, Move
+from   player.minmax.transposition \
+                                import Bound, TranspositionTable
+from   player.minmax.vectorized import VectorizedEvaluator, require_numpy
 from   state.board_state        import BoardState
 
 if TYPE_CHECKING:
     from game import GameManager
 logger = logging.getLogger(__name__)
 
+# Iteration cap for time-controlled searches without an explicit max_depth.
+MAX_SEARCH_DEPTH = 64
+
 
 class ComputerPlayer(Player):
     @abstractmethod
@@ -48,7 +57,7 @@ class GreedyPlayer(ComputerPlayer):
         Evaluate a move for a coin to a destination using distance metrics.
         Returns a tuple for sorting preference.
         """
-        valuation_engine = DistanceMetrics(board_state.board)
+        valuation_engine = board_state.board.metrics
         return (
             valuation_engine.positive_distance(coin, dst),
             valuation_engine.distance(coin.point, dst),
@@ -68,9 +77,7 @@ class GreedyPlayer(ComputerPlayer):
         Computes the best move for any of the player's coins.
         Returns a (coin, destination) tuple, or None if no moves are possible.
         """
-        coins = [
-            coin for coin in game.get_all_coins() if game.is_players_coin(coin, self)
-        ]
+        coins = game.coins_of(self)
         coin_move_map = {
             coin: move for coin in coins if (move := self.get_best_move(game, coin))
         }
@@ -84,13 +91,86 @@ class GreedyPlayer(ComputerPlayer):
 class MinMaxPlayer(ComputerPlayer):
     """
     A player that uses the Minimax algorithm to compute the best move.
-    This is a placeholder for future implementation.
+
+    With `in_place` (the default) the search mutates a single private copy of the
+    board through make_move/unmake_move; otherwise every child node is a fresh
+    copy of its parent. Both modes explore the same tree and pick the same move.
+
+    Results are memoised in a transposition table of `tt_size_mb` megabytes
+    (0 disables it) that persists across turns, and per-coin legal moves in an
+    LRU cache of at most `move_cache_size` positions. Counters for the most
+    recent search are kept in `search_stats`.
+
+    Given a `time_limit` (seconds), the player ignores `depth` and deepens
+    iteratively up to `max_depth`, returning the best move of the last iteration
+    that finished within the budget. With an `aspiration_window`, iterations
+    after the first search a window of that half-width around the previous
+    score and widen it exponentially when the score falls outside.
+
+    With `pvs`, two-player games are searched with principal variation search:
+    moves after the first are tried with a null window and only re-searched
+    when they might be better. With more players, or without the flag, the
+    search is paranoid alpha-beta.
+
+    With `quiescence_depth` > 0, horizon nodes are extended by up to that many
+    plies of long jump chains (advancing a coin by `quiescence_progress` cells
+    or more) before being evaluated.
+
+    Two selective options are off by default. `lmr` trades exactness for depth:
+    moves after the first LMR_FULL_MOVES are searched one ply shallower (from
+    LMR_MIN_DEPTH on) and re-searched at full depth if they look better than the
+    best so far. `futility` keeps the result: one ply above the horizon it skips
+    moves of the max player that the evaluator proves cannot lift the score to
+    alpha. Min nodes are never pruned, so in two-player games only odd depths
+    prune at all, and the vectorized evaluator proves nothing, so it prunes no
+    moves.
+
+    With `ordering` (the default), each node's top_k moves are searched killer
+    moves first, then by history score, instead of in static greedy order; the
+    set of moves searched is unchanged.
+
+    Leaves are scored incrementally by default; `vectorized_eval` switches to the
+    NumPy evaluator (same scores), which needs NumPy installed.
     """
 
-    def __init__(self, player_id: int, depth: int = 3, top_k: int = 5) -> None:
+    def __init__(
+        self,
+        player_id: int,
+        depth: int = 3,
+        top_k: int = 5,
+        in_place: bool = True,
+        tt_size_mb: float = 16,
+        move_cache_size: int = 10_000,
+        time_limit: Optional[float] = None,
+        max_depth: Optional[int] = None,
+        vectorized_eval: bool = False,
+        pvs: bool = False,
+        ordering: bool = True,
+        aspiration_window: Optional[float] = None,
+        quiescence_depth: int = 0,
+        quiescence_progress: int = QUIESCENCE_PROGRESS,
+        lmr: bool = False,
+        futility: bool = False,
+    ) -> None:
         super().__init__(player_id)
+        if vectorized_eval:
+            require_numpy()
         self.depth = depth
         self.top_k = top_k
+        self.in_place = in_place
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.vectorized_eval = vectorized_eval
+        self.pvs = pvs
+        self.ordering = ordering
+        self.aspiration_window = aspiration_window
+        self.quiescence_depth = quiescence_depth
+        self.quiescence_progress = quiescence_progress
+        self.lmr = lmr
+        self.futility = futility
+        self.table = TranspositionTable(tt_size_mb) if tt_size_mb > 0 else None
+        self.move_cache: MoveCache = MoveCache(move_cache_size)
+        self.search_stats = SearchStats()
 
     @staticmethod
     def minimax_ab(
@@ -101,71 +181,407 @@ class MinMaxPlayer(ComputerPlayer):
         maximizing_player: Player,
         alpha=float("-inf"),
         beta=float("inf"),
+        context: Optional[SearchContext] = None,
     ) -> tuple[float, Optional[Move]]:
         """
-        Minimax algorithm with alpha-beta pruning.
+        Minimax algorithm with alpha-beta pruning (paranoid for more than two
+        players, principal variation search for two when the context asks).
         """
-        if depth == 0 or state.is_terminal():
+        context = context or SearchContext()
+        context.check_time()
+        context.stats.nodes += 1
+        if depth == 0:
+            if context.quiescence_depth:
+                value = MinMaxPlayer.quiescence(
+                    state,
+                    context.quiescence_depth,
+                    top_k,
+                    maximizing_player,
+                    alpha,
+                    beta,
+                    context,
+                )
+                return value, None
+            return state.evaluate(), None
+
+        table = context.table
+        key = state.position_key() if table is not None or context.pv else None
+        tt_move = None
+        if table is not None:
+            context.stats.tt_probes += 1
+            entry = table.probe(key)
+            if entry is not None:
+                context.stats.tt_hits += 1
+                tt_move = entry.move
+                if entry.depth >= depth:
+                    if entry.bound == Bound.LOWER:
+                        alpha = max(alpha, entry.score)
+                    elif entry.bound == Bound.UPPER:
+                        beta = min(beta, entry.score)
+                    if entry.bound == Bound.EXACT or beta <= alpha:
+                        context.stats.tt_cutoffs += 1
+                        return entry.score, entry.move
+
+        if state.is_terminal():
             return state.evaluate(), None
 
         current = state.current_player()
-        legal_moves = state.get_legal_moves()[:top_k]
-        logger.debug(
-            f"Current player: {current}, Depth: {depth}, Legal moves: {legal_moves}"
+        # Search the previous iteration's PV move first, then the table's move;
+        # the rest are only generated if neither of them cuts off.
+        rank = context.move_rank if context.ordering else None
+        legal_moves = state.generate_moves(
+            top_k, (context.pv.get(key), tt_move), rank
         )
+        logger.debug(f"Current player: {current}, Depth: {depth}")
         best_move = None
-
-        if current == maximizing_player:
-            value = float("-inf")
-            for move in legal_moves:
-                next_state = state.apply_move(move)
-                child_score, _ = MinMaxPlayer.minimax_ab(
-                    next_state,
+        window = (alpha, beta)
+        maximizing = current == maximizing_player
+        # Paranoid search: everybody else minimizes the max player's score. With
+        # two players that is plain minimax, where PVS applies.
+        pvs = context.pvs and total_players == 2
+        value = float("-inf") if maximizing else float("inf")
+        # At max frontier nodes, the static score plus the evaluator's bound on
+        # a move's gain bounds the child's score; with quiescence too, as the
+        # minimizing side may stand pat. Min nodes are not pruned: an opponent's
+        # move can lower the max player's penalties by no bound known cheaply.
+        futile = context.futility and depth == 1 and maximizing
+        static = state.evaluate() if futile else None
+        for index, move in enumerate(legal_moves):
+            if static is not None and index:
+                bound = static + state.evaluation_gain_bound(move)
+                if bound <= alpha:
+                    context.stats.futility_prunes += 1
+                    # The bound is proven, so failing soft on it keeps table
+                    # entries sound.
+                    value = max(value, bound)
+                    continue
+            if pvs and index:
+                # Scores are integers, so a null window proves the move is no
+                # better than the best so far; re-search only if it is.
+                child_window = (alpha, alpha + 1) if maximizing else (beta - 1, beta)
+                context.stats.null_window_searches += 1
+            else:
+                child_window = (alpha, beta)
+            reduction = int(
+                context.lmr and index >= LMR_FULL_MOVES and depth >= LMR_MIN_DEPTH
+            )
+            context.stats.lmr_reductions += reduction
+            child_score = MinMaxPlayer.search_child(
+                state,
+                move,
+                depth - 1 - reduction,
+                top_k,
+                total_players,
+                maximizing_player,
+                *child_window,
+                context,
+            )
+            improves = child_score > alpha if maximizing else child_score < beta
+            if reduction and improves:
+                # The shallow search says the move beats the best so far; only a
+                # full-depth search may say so.
+                context.stats.lmr_researches += 1
+                child_score = MinMaxPlayer.search_child(
+                    state,
+                    move,
+                    depth - 1,
+                    top_k,
+                    total_players,
+                    maximizing_player,
+                    *child_window,
+                    context,
+                )
+            if pvs and index and alpha < child_score < beta:
+                context.stats.researches += 1
+                child_score = MinMaxPlayer.search_child(
+                    state,
+                    move,
                     depth - 1,
                     top_k,
                     total_players,
                     maximizing_player,
                     alpha,
                     beta,
+                    context,
                 )
-                if best_move is None or child_score > value:
-                    value = child_score
-                    best_move = move
+            if (
+                best_move is None
+                or (maximizing and child_score > value)
+                or (not maximizing and child_score < value)
+            ):
+                value = child_score
+                best_move = move
+            if maximizing:
                 alpha = max(alpha, value)
-                if beta <= alpha:
-                    break  # Beta cutoff
-            return value, best_move
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                context.stats.cutoffs += 1
+                context.stats.first_move_cutoffs += index == 0
+                if context.ordering:
+                    slot, _ = context.move_rank(move)
+                    context.stats.killer_cutoffs += slot > 0
+                    context.record_cutoff(move, depth)
+                break  # Beta cutoff at max nodes, alpha cutoff at min nodes
+
+        if table is not None:
+            assert key is not None
+            table.store(key, depth, value, bound_type(value, *window), best_move)
+        return value, best_move
+
+    @staticmethod
+    def quiescence(
+        state: MinMaxState,
+        depth: int,
+        top_k: int,
+        maximizing_player: Player,
+        alpha: float,
+        beta: float,
+        context: SearchContext,
+    ) -> float:
+        """
+        Extends a horizon node with long jump chains only, up to `depth` plies.
+
+        The side to move may always decline to jump (stand pat), so the static
+        evaluation bounds the node's value from its side; jump chains that
+        advance a coin by at least `context.quiescence_progress` are then tried
+        to settle scores that are about to swing.
+        """
+        context.check_time()
+        context.stats.quiescence_nodes += 1
+        value = state.evaluate()
+        maximizing = state.current_player() == maximizing_player
+        if maximizing:
+            alpha = max(alpha, value)
         else:
-            # Treat others as adversarial: minimize max player's score
-            value = float("inf")
-            for move in legal_moves:
-                next_state = state.apply_move(move)
-                child_score, _ = MinMaxPlayer.minimax_ab(
-                    next_state,
+            beta = min(beta, value)
+        if depth == 0 or beta <= alpha or state.is_terminal():
+            return value
+
+        for move in state.get_noisy_moves(context.quiescence_progress, top_k):
+            child = state if context.in_place else state.apply_move(move)
+            if context.in_place:
+                state.make_move(move)
+            try:
+                child_score = MinMaxPlayer.quiescence(
+                    child,
                     depth - 1,
                     top_k,
-                    total_players,
                     maximizing_player,
                     alpha,
                     beta,
+                    context,
                 )
-                if best_move is None or child_score < value:
-                    value = child_score
-                    best_move = move
+            finally:
+                if context.in_place:
+                    state.unmake_move()
+            if maximizing and child_score > value:
+                value = child_score
+                alpha = max(alpha, value)
+            elif not maximizing and child_score < value:
+                value = child_score
                 beta = min(beta, value)
-                if beta <= alpha:
-                    break  # Alpha cutoff
-            return value, best_move
+            if beta <= alpha:
+                break
+        return value
+
+    @staticmethod
+    def search_child(
+        state: MinMaxState,
+        move: Move,
+        depth: int,
+        top_k: int,
+        total_players: int,
+        maximizing_player: Player,
+        alpha: float,
+        beta: float,
+        context: SearchContext,
+    ) -> float:
+        """
+        Scores the position reached by `move`, searching either a copy of `state`
+        or `state` itself (restored before returning).
+        """
+        child = state if context.in_place else state.apply_move(move)
+        if context.in_place:
+            state.make_move(move)
+        context.ply += 1
+        try:
+            child_score, _ = MinMaxPlayer.minimax_ab(
+                child,
+                depth,
+                top_k,
+                total_players,
+                maximizing_player,
+                alpha,
+                beta,
+                context,
+            )
+        finally:
+            context.ply -= 1
+            if context.in_place:
+                state.unmake_move()
+        return child_score
 
     def compute_move(self, game: "GameManager") -> tuple[Coin, Point]:
-        _, move = self.minimax_ab(
-            GameStateWrapper(game.game_state, self),
-            self.depth,
-            self.top_k,
-            len(game.players),
-            self,
+        context = SearchContext(
+            in_place=self.in_place,
+            table=self.table,
+            pvs=self.pvs,
+            ordering=self.ordering,
+            quiescence_depth=self.quiescence_depth,
+            quiescence_progress=self.quiescence_progress,
+            lmr=self.lmr,
+            futility=self.futility,
         )
+        if self.table is not None:
+            self.table.new_search()
+        self.move_cache.new_turn()
+        evaluator = None
+        if self.vectorized_eval:
+            # Bound to the live board only as a template; the root copies it.
+            game_state = game.game_state
+            evaluator = VectorizedEvaluator(
+                game_state.board_state,
+                game_state.player_id_region_map[self.player_id],
+            )
+        root = GameStateWrapper(game.game_state, self, self.move_cache, evaluator)
+        if self.time_limit is None:
+            _, move = self.minimax_ab(
+                root,
+                self.depth,
+                self.top_k,
+                len(game.players),
+                self,
+                context=context,
+            )
+            context.stats.completed_depth = self.depth
+        else:
+            move = self.iterative_deepening(root, len(game.players), context)
+        context.stats.move_cache_hits = self.move_cache.hits
+        context.stats.move_cache_misses = self.move_cache.misses
+        self.search_stats = context.stats
+        logger.info(f"Player {self.player_id} search stats: {context.stats}")
         if move is None:
             raise ValueError(f"No valid moves available for Player {self.player_id}.")
         logger.debug(f"Computed move: {move}")
         return move.coin, move.dst
+
+    def iterative_deepening(
+        self, root: GameStateWrapper, total_players: int, context: SearchContext
+    ) -> Optional[Move]:
+        """
+        Searches depth 1, 2, ... until `time_limit` runs out or `max_depth` is done.
+
+        Returns the best move of the deepest completed iteration. Before the first
+        iteration completes, the best statically ordered move stands in, so a move
+        is always available when the deadline hits.
+        """
+        assert self.time_limit is not None
+        context.deadline = time.monotonic() + self.time_limit
+        legal_moves = root.get_legal_moves(1)
+        if not legal_moves:
+            return None
+        best_move = legal_moves[0]
+        score: Optional[float] = None
+        for depth in range(1, (self.max_depth or MAX_SEARCH_DEPTH) + 1):
+            try:
+                if self.aspiration_window is None or score is None:
+                    score, move = self.minimax_ab(
+                        root,
+                        depth,
+                        self.top_k,
+                        total_players,
+                        self,
+                        context=context,
+                    )
+                else:
+                    score, move = self.aspiration_search(
+                        root, depth, total_players, context, score
+                    )
+            except SearchTimeout:
+                logger.debug(f"Search timed out during depth {depth}")
+                break
+            if move is None:
+                break
+            best_move = move
+            context.stats.completed_depth = depth
+            context.pv = self.principal_variation(root, move, depth, context)
+        return best_move
+
+    def aspiration_search(
+        self,
+        root: GameStateWrapper,
+        depth: int,
+        total_players: int,
+        context: SearchContext,
+        guess: float,
+    ) -> tuple[float, Optional[Move]]:
+        """
+        Searches the root with a window of +/- `aspiration_window` around `guess`
+        (the previous iteration's score). A result outside the window only bounds
+        the true score, so the failing side is widened, doubling each time, and
+        the root is searched again.
+        """
+        assert self.aspiration_window is not None
+        context.stats.aspiration_searches += 1
+        width = self.aspiration_window
+        alpha, beta = guess - width, guess + width
+        while True:
+            value, move = self.minimax_ab(
+                root,
+                depth,
+                self.top_k,
+                total_players,
+                self,
+                alpha,
+                beta,
+                context,
+            )
+            if alpha < value < beta:
+                return value, move
+            width *= 2
+            context.stats.aspiration_researches += 1
+            if value <= alpha:
+                alpha = guess - width
+            else:
+                beta = guess + width
+
+    @staticmethod
+    def principal_variation(
+        root: MinMaxState, best_move: Move, depth: int, context: SearchContext
+    ) -> dict[int, Move]:
+        """
+        Follows the transposition table from the root along best moves, returning
+        the principal variation keyed by position key.
+        """
+        pv: dict[int, Move] = {}
+        state, made = root, 0
+        move: Optional[Move] = best_move
+        try:
+            while move is not None and len(pv) < depth:
+                key = state.position_key()
+                if key in pv:
+                    break
+                pv[key] = move
+                if context.in_place:
+                    state.make_move(move)
+                    made += 1
+                else:
+                    state = state.apply_move(move)
+                if context.table is None:
+                    break
+                entry = context.table.probe(state.position_key())
+                move = entry.move if entry is not None else None
+        finally:
+            for _ in range(made):
+                root.unmake_move()
+        return pv
+
+
+def bound_type(value: float, alpha: float, beta: float) -> Bound:
+    """Classifies a fail-soft search result against the window it was searched with."""
+    if value <= alpha:
+        return Bound.UPPER
+    if value >= beta:
+        return Bound.LOWER
+    return Bound.EXACT
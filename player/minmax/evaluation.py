@@ -0,0 +1,211 @@
+from   abc                      import ABC, abstractmethod
+from   typing                   import Iterable, NamedTuple
+
+from   board                    import Coin
+from   board.topology           import OFF_BOARD
+from   state                    import BoardState
+from   state.board_state        import Reachability
+
+
+def isolation_penalty(board_state: BoardState, coin: Coin, reach: Reachability) -> int:
+    """
+    GameStateWrapper.isolated_coin_penalty computed from the coin's reachability:
+    min(best forward progress - 3, 0).
+    """
+    progress = board_state.board.metrics.progress[coin.region]
+    origin = board_state.topology.index[coin.point]
+    max_step = max((progress[dst] - progress[origin] for dst in reach.moves), default=0)
+    return min(max_step - 3, 0)
+
+
+def behind_limits(board_state: BoardState) -> list[float]:
+    """
+    Per region, the distance to the destination corner beyond which an own coin
+    counts as left behind: a third of the corner-to-corner trip.
+    """
+    topology, metrics = board_state.topology, board_state.board.metrics
+    return [
+        metrics.cell_distance(source, destination) / 3 if source != OFF_BOARD else 0
+        for source, destination in zip(
+            topology.source_corner, topology.destination_corner
+        )
+    ]
+
+
+class Evaluator(ABC):
+    """Scores the positions of the board it is bound to as moves are played."""
+
+    @abstractmethod
+    def move(self, src: int, dst: int, region: int) -> None:
+        """Accounts for a coin of `region` moving from cell `src` to cell `dst`."""
+        pass
+
+    @abstractmethod
+    def unmake(self) -> None:
+        """Reverts the most recent `move`."""
+        pass
+
+    @abstractmethod
+    def score(self) -> int:
+        """Returns the evaluation of the current position."""
+        pass
+
+    def gain_bound(self, src: int, dst: int, region: int) -> float:
+        """
+        Bounds how much `score()` can rise when a coin of `region` moves from
+        `src` to `dst`. Evaluators that cannot tell return infinity.
+        """
+        return float("inf")
+
+    @abstractmethod
+    def copy(self, board_state: BoardState) -> "Evaluator":
+        """Returns an evaluator for `board_state`, a copy of this one's board."""
+        pass
+
+
+class PenaltyEntry(NamedTuple):
+    penalty: int
+    footprint: frozenset[int]  # Every cell the coin's move search read.
+
+
+class IncrementalEvaluator(Evaluator):
+    """
+    Maintains GameStateWrapper.evaluate's score across moves instead of
+    re-walking every coin per leaf.
+
+    The distance term (own coins count -distance to their destination corner,
+    everybody else's +distance) is a running sum updated by a delta per move.
+    Isolation penalties of own coins that are left behind are cached together
+    with the footprint of the move search they came from. A move invalidates only
+    the entries whose footprint holds one of its two cells, and those are
+    recomputed on the next `score()`. State is saved per `move` and restored by
+    `unmake`, so make/unmake searches never recompute what their parent knew.
+
+    Pending penalties are recomputed before `move` saves its frame, so the frame
+    holds them and every sibling searched after `unmake` reuses them; a leaf only
+    recomputes the penalties its own move invalidated.
+
+    The evaluator must see every change of the board it is bound to, through
+    `move`/`unmake`.
+    """
+
+    def __init__(self, board_state: BoardState, own_regions: Iterable[int]) -> None:
+        self.board_state = board_state
+        self.own_regions = frozenset(own_regions)
+        self._remaining = board_state.board.metrics.cell_distance
+        self._behind_limit = behind_limits(board_state)
+        self.distance_score = 0
+        self.penalty_total = 0
+        self.entries: dict[int, PenaltyEntry] = {}
+        self.pending: set[int] = set()
+        for cell, region in enumerate(board_state.occupancy):
+            if region:
+                self.distance_score += self._signed_distance(cell, region)
+                if self._is_behind(cell, region):
+                    self.pending.add(cell)
+        self._frames: list[tuple] = []
+
+    def _signed_distance(self, cell: int, region: int) -> int:
+        remaining = self._remaining(
+            cell, self.board_state.topology.destination_corner[region]
+        )
+        return -remaining if region in self.own_regions else remaining
+
+    def _is_behind(self, cell: int, region: int) -> bool:
+        destination = self.board_state.topology.destination_corner[region]
+        return (
+            region in self.own_regions
+            and self._remaining(cell, destination) > self._behind_limit[region]
+        )
+
+    def _penalty_entry(self, cell: int) -> PenaltyEntry:
+        """Searches the coin's moves, as isolated_coin_penalty does, once."""
+        board_state = self.board_state
+        topology = board_state.topology
+        coin = board_state.point_coin_map[topology.points[cell]]
+        reach = board_state.reachable(coin)
+        # Exactly the cells reachable() read: the origin's neighbors for steps,
+        # and both cells of every jump tried from the origin or a landing.
+        footprint = {cell, *topology.neighbors[cell]}
+        for expanded in reach.expanded:
+            for over, landing in topology.jumps[expanded]:
+                footprint.add(over)
+                footprint.add(landing)
+        footprint.discard(OFF_BOARD)
+        return PenaltyEntry(
+            isolation_penalty(board_state, coin, reach), frozenset(footprint)
+        )
+
+    def _refresh(self) -> None:
+        """Recomputes the pending penalties into the current entries."""
+        for cell in self.pending:
+            entry = self._penalty_entry(cell)
+            self.entries[cell] = entry
+            self.penalty_total += entry.penalty
+        self.pending = set()
+
+    def move(self, src: int, dst: int, region: int) -> None:
+        """Applies the move's distance delta and invalidates affected penalties."""
+        if self.pending:
+            self._refresh()
+        self._frames.append(
+            (self.distance_score, self.penalty_total, self.entries, self.pending)
+        )
+        delta = self._signed_distance(dst, region) - self._signed_distance(src, region)
+        self.distance_score += delta
+
+        # Copy-on-write: the saved dict/set stay valid for the parent position.
+        entries: dict[int, PenaltyEntry] = {}
+        pending = set(self.pending)
+        pending.discard(src)
+        penalty_total = 0
+        for cell, entry in self.entries.items():
+            if cell == src:
+                continue
+            if src in entry.footprint or dst in entry.footprint:
+                pending.add(cell)
+            else:
+                entries[cell] = entry
+                penalty_total += entry.penalty
+        if self._is_behind(dst, region):
+            pending.add(dst)
+        self.entries, self.pending, self.penalty_total = entries, pending, penalty_total
+
+    def unmake(self) -> None:
+        """Restores the state saved by the matching `move`."""
+        (
+            self.distance_score,
+            self.penalty_total,
+            self.entries,
+            self.pending,
+        ) = self._frames.pop()
+
+    def gain_bound(self, src: int, dst: int, region: int) -> int:
+        """
+        The exact distance delta, plus every penalty the move could clear: those
+        of the moved coin and of coins whose footprint holds `src` or `dst`.
+        Recomputed penalties are never positive, and all others stay as they are.
+        """
+        if self.pending:
+            self._refresh()
+        bound = self._signed_distance(dst, region) - self._signed_distance(src, region)
+        for cell, entry in self.entries.items():
+            if cell == src or src in entry.footprint or dst in entry.footprint:
+                bound -= entry.penalty
+        return bound
+
+    def score(self) -> int:
+        """Recomputes invalidated penalties, then returns the running score."""
+        if self.pending:
+            self._refresh()
+        return self.distance_score + self.penalty_total
+
+    def copy(self, board_state: BoardState) -> "IncrementalEvaluator":
+        """Returns an evaluator for `board_state`, a copy of this one's board."""
+        clone = object.__new__(IncrementalEvaluator)
+        clone.__dict__.update(self.__dict__)
+        clone.board_state = board_state
+        clone.entries = dict(self.entries)
+        clone.pending = set(self.pending)
+        clone._frames = []
+        return clone
@@ -0,0 +1,57 @@
+from   collections              import OrderedDict
+from   typing                   import Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class MoveCache(Generic[V]):
+    """
+    Bounded LRU cache for per-coin move lists, keyed by (position hash, coin).
+
+    Because keys identify the position rather than the search node, one cache can
+    be shared by every node of a search (and across turns) while its memory stays
+    capped at `maxsize` entries. Hit/miss counters cover the current turn.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        assert maxsize > 0, "MoveCache needs room for at least one entry"
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, V] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Returns the cached value for `key`, marking it most recently used."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Stores a value, evicting the least recently used entry when full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def new_turn(self) -> None:
+        """
+        Resets the per-turn counters. Entries are kept and age out through LRU
+        eviction, so positions from the previous search can still be reused.
+        """
+        self.hits = self.misses = 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.new_turn()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
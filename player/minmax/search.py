@@ -0,0 +1,120 @@
+from   dataclasses              import asdict, dataclass, field
+import time
+from   typing                   import Hashable, Optional, TYPE_CHECKING
+
+from   player.minmax.transposition \
+                                import TranspositionTable
+
+if TYPE_CHECKING:
+    from player.minmax.state import Move
+
+# Killer moves remembered per ply.
+KILLER_SLOTS = 2
+# Default cells a move must advance its coin to be searched in quiescence:
+# a step advances at most one, a jump two, so this takes two-jump chains.
+QUIESCENCE_PROGRESS = 4
+# Late move reductions: moves searched at full depth before reducing, and the
+# least remaining depth at which a move is reduced (by one ply).
+LMR_FULL_MOVES = 2
+LMR_MIN_DEPTH = 3
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search once the context's deadline has passed."""
+
+
+@dataclass
+class SearchStats:
+    """Counters collected over one compute_move search."""
+
+    nodes: int = 0
+    completed_depth: int = 0
+    tt_probes: int = 0
+    tt_hits: int = 0
+    tt_cutoffs: int = 0
+    move_cache_hits: int = 0
+    move_cache_misses: int = 0
+    null_window_searches: int = 0
+    researches: int = 0
+    cutoffs: int = 0
+    first_move_cutoffs: int = 0
+    killer_cutoffs: int = 0
+    aspiration_searches: int = 0
+    aspiration_researches: int = 0
+    quiescence_nodes: int = 0
+    lmr_reductions: int = 0
+    lmr_researches: int = 0
+    futility_prunes: int = 0
+
+    def __str__(self) -> str:
+        return ", ".join(f"{name}={value}" for name, value in asdict(self).items())
+
+
+@dataclass
+class SearchContext:
+    """
+    Mutable state threaded through a single minimax search.
+
+    Attributes:
+        in_place (bool): Expand children with make/unmake instead of copies.
+        table (TranspositionTable | None): Transposition table, if enabled.
+        deadline (float | None): time.monotonic() value at which to abort.
+        pv (dict[int, Move]): Principal variation of the previous iteration,
+            keyed by position key; these moves are searched first.
+        pvs (bool): Use principal variation search in two-player games.
+        ordering (bool): Reorder each node's moves with killers and history.
+        quiescence_depth (int): Plies of jump-chain extension at the horizon.
+        quiescence_progress (int): Minimum advance of a quiescence move, in cells.
+        lmr (bool): Search late moves one ply shallower, re-searching on a fail
+            high.
+        futility (bool): Skip moves at max frontier nodes whose proven bound
+            on the child's score cannot reach the window; min nodes are never
+            pruned.
+        ply (int): Distance of the node being searched from the root.
+        killers (dict[int, list[Move]]): Per ply, the last KILLER_SLOTS distinct
+            moves that caused a cutoff, most recent first.
+        history (dict[Hashable, int]): (region, from, to) -> depth^2 summed over
+            the cutoffs the move caused.
+        stats (SearchStats): Counters for this search.
+    """
+
+    in_place: bool = False
+    table: Optional[TranspositionTable] = None
+    deadline: Optional[float] = None
+    pv: dict[int, "Move"] = field(default_factory=dict)
+    pvs: bool = False
+    ordering: bool = False
+    quiescence_depth: int = 0
+    quiescence_progress: int = QUIESCENCE_PROGRESS
+    lmr: bool = False
+    futility: bool = False
+    ply: int = 0
+    killers: dict[int, list["Move"]] = field(default_factory=dict)
+    history: dict[Hashable, int] = field(default_factory=dict)
+    stats: SearchStats = field(default_factory=SearchStats)
+
+    def check_time(self) -> None:
+        """Raises SearchTimeout if the deadline has passed."""
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SearchTimeout
+
+    @staticmethod
+    def history_key(move: "Move") -> Hashable:
+        """(region, from point, to point): points stand for their cells 1:1."""
+        return move.coin.region, move.coin.point, move.dst
+
+    def move_rank(self, move: "Move") -> tuple[int, int]:
+        """Sort key for ordering: killer slot at this ply first, then history."""
+        killers = self.killers.get(self.ply, ())
+        slot = KILLER_SLOTS - killers.index(move) if move in killers else 0
+        return slot, self.history.get(self.history_key(move), 0)
+
+    def record_cutoff(self, move: "Move", depth: int) -> None:
+        """Credits a move that caused a cutoff at the current ply."""
+        killers = self.killers.setdefault(self.ply, [])
+        if move in killers:
+            killers.remove(move)
+        killers.insert(0, move)
+        del killers[KILLER_SLOTS:]
+        key = self.history_key(move)
+        self.history[key] = self.history.get(key, 0) + depth * depth
@@ -1,14 +1,15 @@
 from   abc                      import ABC, abstractmethod
-import copy
 from   dataclasses              import dataclass
-import functools
+import heapq
 import logging
-from   typing                   import Optional
+from   typing                   import Any, Callable, Iterable, Iterator, Optional
 
 from   board                    import Coin
-from   board.metrics            import DistanceMetrics
+from   board.topology           import OFF_BOARD
 from   geometry                 import Point
 from   player.base              import Player
+from   player.minmax.evaluation import Evaluator, IncrementalEvaluator
+from   player.minmax.move_cache import MoveCache
 from   state                    import GameState
 
 logger = logging.getLogger(__name__)
@@ -27,15 +28,65 @@ class MinMaxState(ABC):
         pass
 
     @abstractmethod
-    def get_legal_moves(self) -> list[Move]:
-        """Returns a list of all legal moves for the current player."""
+    def position_key(self) -> int:
+        """Returns a hash identifying the position and the side to move."""
         pass
 
+    @abstractmethod
+    def get_legal_moves(self, limit: Optional[int] = None) -> list[Move]:
+        """Returns the current player's legal moves, best first (at most `limit`)."""
+        pass
+
+    def generate_moves(
+        self,
+        top_k: int,
+        preferred: Iterable[Optional[Move]] = (),
+        rank: Optional[Callable[[Move], Any]] = None,
+    ) -> Iterator[Move]:
+        """
+        Yields the `top_k` best legal moves, with any of the `preferred` moves among
+        them first and the rest reordered by descending `rank` (static order
+        breaking ties). Subclasses may generate lazily so that a cutoff on an early
+        move skips generating the rest.
+        """
+        legal_moves = self.get_legal_moves(top_k)
+        first = [m for m in dict.fromkeys(preferred) if m in legal_moves]
+        rest = [move for move in legal_moves if move not in first]
+        if rank is not None:
+            rest.sort(key=rank, reverse=True)
+        yield from first
+        yield from rest
+
+    def get_noisy_moves(self, min_progress: int, limit: int) -> list[Move]:
+        """
+        Returns up to `limit` of the current player's moves that advance a coin by
+        at least `min_progress`, best first, for quiescence search. States that
+        cannot tell return none, which makes quiescence a plain evaluation.
+        """
+        return []
+
+    def evaluation_gain_bound(self, move: Move) -> float:
+        """
+        Bounds how much `move` can raise `evaluate()`, for futility pruning.
+        States that cannot tell return infinity, which disables the pruning.
+        """
+        return float("inf")
+
     @abstractmethod
     def apply_move(self, move: Move) -> "MinMaxState":
         """Returns a new state after applying the given move."""
         pass
 
+    @abstractmethod
+    def make_move(self, move: Move) -> None:
+        """Applies the given move to this state in place."""
+        pass
+
+    @abstractmethod
+    def unmake_move(self) -> None:
+        """Reverts the most recent make_move."""
+        pass
+
     @abstractmethod
     def is_terminal(self) -> bool:
         """Returns True if the state is terminal (win or no moves)."""
@@ -50,22 +101,50 @@ class MinMaxState(ABC):
 class GameStateWrapper(MinMaxState):
     """
     Wraps a GameState for use in minimax search, copying board state for isolation.
+
+    The wrapper can either be expanded by copying (`apply_move`) or mutated in
+    place (`make_move` / `unmake_move`); the copied board keeps the caller's
+    game untouched in both cases. Per-coin legal moves are memoised in a
+    MoveCache keyed by board hash, shared with every wrapper derived from this one.
+
+    `evaluate` is served by an Evaluator (by default an IncrementalEvaluator; a
+    given one is copied onto the wrapper's board) that follows both kinds of
+    expansion; `full_evaluate` recomputes the same score from scratch. Moving
+    coins on `game.board_state` directly bypasses the evaluator.
     """
 
-    def __init__(self, game: GameState, player: Optional[Player]) -> None:
+    def __init__(
+        self,
+        game: GameState,
+        player: Optional[Player],
+        move_cache: Optional[MoveCache] = None,
+        evaluator: Optional[Evaluator] = None,
+    ) -> None:
         self.game = GameState(
-            board_state=copy.deepcopy(game.board_state),
+            board_state=game.board_state.copy(),
             players=game.players,
             player_id_region_map=game.player_id_region_map,
             current_player_index=game.current_player_index,
         )
         self.player = player or game.current_player()
+        self.move_cache = move_cache if move_cache is not None else MoveCache()
+        board_state = self.game.board_state
+        self.evaluator = (
+            evaluator.copy(board_state)
+            if evaluator is not None
+            else IncrementalEvaluator(
+                board_state, game.player_id_region_map[self.player.player_id]
+            )
+        )
 
     def current_player(self) -> Player:
         """Returns the current player object."""
         return self.game.current_player()
 
-    @functools.lru_cache(maxsize=None)
+    def position_key(self) -> int:
+        """Returns the Zobrist key of the wrapped position and side to move."""
+        return self.game.position_key()
+
     def get_legal_moves_for_coin(
         self, coin: Coin
     ) -> list[tuple[Move, tuple[float, float]]]:
@@ -74,60 +153,188 @@ class GameStateWrapper(MinMaxState):
         """
         from player.computer import GreedyPlayer
 
-        return [
-            (Move(coin, dst), GreedyPlayer.evaluate(self.game.board_state, coin, dst))
-            for dst in self.game.valid_moves(coin)
-        ]
+        board_state = self.game.board_state
+        key = (board_state.zobrist, coin)
+        moves = self.move_cache.get(key)
+        if moves is None:
+            points = board_state.topology.points
+            moves = [
+                (
+                    Move(coin, points[cell]),
+                    GreedyPlayer.evaluate(board_state, coin, points[cell]),
+                )
+                for cell in board_state.reachable(coin).moves
+            ]
+            self.move_cache.put(key, moves)
+        return moves
 
-    def get_legal_moves(self) -> list[Move]:
+    def get_legal_moves(self, limit: Optional[int] = None) -> list[Move]:
         """
         Returns all legal moves for the current player, sorted by move score.
+        With a `limit`, only the best `limit` moves are selected (by a partial
+        heap selection rather than a full sort).
         """
-        move_scores = [
+        move_scores = (
             (move, score)
-            for coin in self.game.get_all_coins()
-            if self.game.is_players_coin(coin)
+            for coin in self.game.coins_of()
             for move, score in self.get_legal_moves_for_coin(coin)
-        ]
-        if not move_scores:
-            return []
-        move_scores.sort(key=lambda ms: ms[1], reverse=True)
-        logger.debug(
-            f"Legal moves for player {self.player.player_id}: {move_scores[:5]} (total: {len(move_scores)})"
         )
-        return [move for move, _ in move_scores]
+        best = self.select_best(move_scores, limit)
+        logger.debug(f"Legal moves for player {self.player.player_id}: {best[:5]}")
+        return best
+
+    def get_noisy_moves(self, min_progress: int, limit: int) -> list[Move]:
+        """
+        Returns up to `limit` of the current player's moves that bring their coin at
+        least `min_progress` cells closer to its destination corner (jump chains),
+        in the same order as get_legal_moves.
+        """
+        move_scores = []
+        for coin in self.game.coins_of():
+            move_scores.extend(
+                (move, score)
+                for move, score in self.get_legal_moves_for_coin(coin)
+                if self.move_progress(move) >= min_progress
+            )
+        return self.select_best(move_scores, limit)
+
+    def evaluation_gain_bound(self, move: Move) -> float:
+        """Asks the evaluator; the vectorized one cannot tell."""
+        index = self.game.board.topology.index
+        return self.evaluator.gain_bound(
+            index[move.coin.point], index[move.dst], move.coin.region
+        )
+
+    def move_progress(self, move: Move) -> int:
+        """Cells the move brings its coin closer to its destination corner."""
+        board = self.game.board
+        topology, distance = board.topology, board.metrics.cell_distance
+        destination = topology.destination_corner[move.coin.region]
+        return distance(topology.index[move.coin.point], destination) - distance(
+            topology.index[move.dst], destination
+        )
+
+    @staticmethod
+    def select_best(
+        move_scores: Iterable[tuple[Move, tuple[float, float]]],
+        limit: Optional[int],
+    ) -> list[Move]:
+        """Sorts scored moves best first, keeping only the best `limit` if given."""
+
+        # Ties are broken on coordinates so the order does not depend on the
+        # board's coin iteration order, which make/unmake does not preserve.
+        def sort_key(ms: tuple[Move, tuple[float, float]]) -> tuple:
+            return ms[1], tuple(ms[0].coin.point), tuple(ms[0].dst)
+
+        if limit is None:
+            best = sorted(move_scores, key=sort_key, reverse=True)
+        else:
+            best = heapq.nlargest(limit, move_scores, key=sort_key)
+        return [move for move, _ in best]
+
+    def is_legal_move(self, move: Move) -> bool:
+        """Checks a move for the current player, generating only its coin's moves."""
+        coin = move.coin
+        player_id = self.current_player().player_id
+        return (
+            self.game.board_state.get_coin(coin.point) == coin
+            and coin.region in self.game.player_id_region_map[player_id]
+            and any(m == move for m, _ in self.get_legal_moves_for_coin(coin))
+        )
+
+    def generate_moves(
+        self,
+        top_k: int,
+        preferred: Iterable[Optional[Move]] = (),
+        rank: Optional[Callable[[Move], Any]] = None,
+    ) -> Iterator[Move]:
+        """
+        Tries the `preferred` (hash/PV) moves first, checked against their own coin
+        only, then yields the remaining `top_k` best moves in descending `rank`
+        order if given (static order breaking ties). Those are only generated if
+        no preferred move caused a cutoff; selecting them scores every move, as
+        the top_k cut needs all scores.
+
+        Preferred moves come from earlier searches of this same position, so they
+        are themselves among its `top_k` best and the searched set is unchanged.
+        """
+        searched: set[Move] = set()
+        for move in dict.fromkeys(preferred):
+            if move is not None and self.is_legal_move(move):
+                searched.add(move)
+                yield move
+        rest = [move for move in self.get_legal_moves(top_k) if move not in searched]
+        if rank is not None:
+            rest.sort(key=rank, reverse=True)
+        yield from rest
 
     def apply_move(self, move: Move) -> "MinMaxState":
         """
         Returns a new GameStateWrapper after applying the given move and advancing the turn.
         """
-        new_game = GameStateWrapper(self.game, self.player)
+        new_game = GameStateWrapper(
+            self.game, self.player, self.move_cache, self.evaluator
+        )
+        new_game.track_move(move)
         new_game.game.board_state.move_coin(move.coin.point, move.dst)
         new_game.game.next_turn()
         return new_game
 
+    def make_move(self, move: Move) -> None:
+        """Applies the move to the wrapped board in place and advances the turn."""
+        self.track_move(move)
+        self.game.board_state.make_move(move.coin.point, move.dst)
+        self.game.next_turn()
+
+    def unmake_move(self) -> None:
+        """Reverts the most recent make_move, including the turn change."""
+        self.game.board_state.unmake_move()
+        self.evaluator.unmake()
+        self.game.previous_turn()
+
+    def track_move(self, move: Move) -> None:
+        """Reports a move about to be played on the wrapped board to the evaluator."""
+        index = self.game.board.topology.index
+        self.evaluator.move(index[move.coin.point], index[move.dst], move.coin.region)
+
+    def has_legal_move(self) -> bool:
+        """
+        Returns True if the current player has at least one legal move.
+
+        Stops at the first coin that can move; the per-coin lists it generates go
+        through the move cache, so expanding the node afterwards reuses them.
+        """
+        return any(
+            self.get_legal_moves_for_coin(coin) for coin in self.game.coins_of()
+        )
+
     def is_terminal(self) -> bool:
         """
         Returns True if the current player has won or has no legal moves.
         """
-        return self.game.has_current_player_won() or not self.get_legal_moves()
+        return self.game.has_current_player_won() or not self.has_legal_move()
 
     def get_destination(self, coin: Coin) -> Point:
         """Returns the destination wedge corner point for a coin based on its region."""
-        return next(
-            point
-            for point in self.game.board.corners
-            if self.game.board.region(point)
-            == self.game.board.opposite_region(coin.region)
-        )
+        topology = self.game.board.topology
+        return self.corner_point(topology.destination_corner[coin.region], coin)
 
     def get_source(self, coin: Coin) -> Point:
         """Returns the source wedge corner  point for a coin based on its region."""
-        return next(
-            point
-            for point in self.game.board.corners
-            if self.game.board.region(point) == coin.region
-        )
+        topology = self.game.board.topology
+        return self.corner_point(topology.source_corner[coin.region], coin)
+
+    def corner_point(self, cell: int, coin: Coin) -> Point:
+        """Returns the point of a corner cell, failing if the board has no corner."""
+        if cell == OFF_BOARD:
+            raise ValueError(f"No on-board wedge corner for region {coin.region}.")
+        return self.game.board.topology.points[cell]
+
+    def hops_to_goal(self, coin: Coin) -> int:
+        """Steps or single jumps a coin needs to reach its goal cells, jumps allowed."""
+        board = self.game.board
+        cell = board.topology.index[coin.point]
+        return board.metrics.cell_hops_to_goal(coin.region, cell)
 
     def isolated_coin_penalty(self, coin: Coin) -> float:
         """
@@ -144,18 +351,26 @@ class GameStateWrapper(MinMaxState):
         return min(max_step - 3, 0)
 
     def evaluate(self) -> float:
+        """
+        Returns an evaluation score for the current state from the perspective of self.player.
+        Maintained incrementally; equal to `full_evaluate()`.
+        """
+        return self.evaluator.score()
+
+    def full_evaluate(self) -> float:
         """
         Returns an evaluation score for the current state from the perspective of self.player.
         Penalizes coins left behind and rewards coins closer to their destination.
         """
         score = 0
+        topology, metrics = self.game.board.topology, self.game.board.metrics
         for coin in self.game.get_all_coins():
-            source, destination = self.get_source(coin), self.get_destination(coin)
-            distance_left: int = DistanceMetrics(self.game.board).distance(
-                coin.point, destination
+            destination = topology.destination_corner[coin.region]
+            distance_left: int = metrics.cell_distance(
+                topology.index[coin.point], destination
             )
-            total_distance = DistanceMetrics(self.game.board).distance(
-                source, destination
+            total_distance = metrics.cell_distance(
+                topology.source_corner[coin.region], destination
             )
             if self.game.is_players_coin(coin, self.player):
                 score -= distance_left
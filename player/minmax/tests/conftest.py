@@ -0,0 +1,14 @@
+import pytest
+
+from   player.minmax.state      import GameStateWrapper
+
+
+@pytest.fixture
+def make_wrapper(make_game_state):
+    """Factory for the root GameStateWrapper of a fresh game, seen by `perspective`."""
+
+    def make(side_count=6, region_map=None, perspective=0):
+        game = make_game_state(side_count, region_map)
+        return GameStateWrapper(game, game.players[perspective])
+
+    return make
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from   player                   import MinMaxPlayer
+from   player.minmax.evaluation import IncrementalEvaluator
+from   player.minmax.search     import SearchContext
+
+
+@pytest.mark.parametrize(
+    "side_count, region_map, perspective",
+    [
+        (6, {0: [1], 1: [4]}, 0),
+        (6, {0: [1], 1: [4]}, 1),
+        (6, {0: [1, 3, 5], 1: [2, 4, 6]}, 0),
+        (4, {0: [1], 1: [3]}, 1),
+        (8, {0: [1], 1: [5]}, 0),
+    ],
+)
+def test_incremental_score_matches_full_evaluation(
+    make_wrapper, side_count, region_map, perspective
+):
+    wrapper = make_wrapper(side_count, region_map, perspective)
+    rng = random.Random(side_count * 10 + perspective)
+    assert wrapper.evaluate() == wrapper.full_evaluate()
+    depth = 0
+    for _ in range(150):
+        if depth and rng.random() < 0.35:
+            wrapper.unmake_move()
+            depth -= 1
+        else:
+            moves = wrapper.get_legal_moves()
+            if not moves:
+                break
+            wrapper.make_move(rng.choice(moves))
+            depth += 1
+        if rng.random() < 0.7:
+            assert wrapper.evaluate() == wrapper.full_evaluate()
+
+
+def test_copied_children_keep_their_own_scores(make_wrapper):
+    wrapper = make_wrapper()
+    rng = random.Random(3)
+    state = wrapper
+    for _ in range(40):
+        moves = state.get_legal_moves()
+        child = state.apply_move(rng.choice(moves))
+        assert child.evaluate() == child.full_evaluate()
+        assert state.evaluate() == state.full_evaluate()
+        state = child
+    assert wrapper.evaluate() == wrapper.full_evaluate()
+
+
+def test_gain_bound_bounds_every_child(make_wrapper):
+    wrapper = make_wrapper()
+    rng = random.Random(5)
+    index = wrapper.game.board.topology.index
+    for _ in range(40):
+        score = wrapper.evaluate()
+        for move in wrapper.get_legal_moves():
+            bound = wrapper.evaluator.gain_bound(
+                index[move.coin.point], index[move.dst], move.coin.region
+            )
+            wrapper.make_move(move)
+            assert wrapper.evaluate() <= score + bound
+            wrapper.unmake_move()
+        wrapper.make_move(rng.choice(wrapper.get_legal_moves(5)))
+
+
+def test_search_leaves_recompute_only_their_own_penalties(make_wrapper, monkeypatch):
+    wrapper = make_wrapper(6, {0: [1, 3, 5], 1: [2, 4, 6]})
+    left_behind = len(wrapper.evaluator.pending)
+    recomputes = []
+    penalty_entry = IncrementalEvaluator._penalty_entry
+
+    def counting_penalty_entry(self, cell):
+        recomputes.append(cell)
+        return penalty_entry(self, cell)
+
+    monkeypatch.setattr(IncrementalEvaluator, "_penalty_entry", counting_penalty_entry)
+    leaves = []
+    evaluate = wrapper.evaluate
+    monkeypatch.setattr(wrapper, "evaluate", lambda: leaves.append(1) or evaluate())
+    context = SearchContext(in_place=True)
+    MinMaxPlayer.minimax_ab(wrapper, 3, 5, 2, wrapper.player, context=context)
+    # Siblings reuse their parent's penalties instead of recomputing all of them.
+    assert left_behind == 30
+    assert len(recomputes) < len(leaves) * left_behind / 2
@@ -0,0 +1,40 @@
+from   player.minmax.move_cache import MoveCache
+
+
+def test_get_put_and_stats():
+    cache = MoveCache(maxsize=4)
+    assert cache.get("a") is None
+    cache.put("a", [1])
+    assert cache.get("a") == [1]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_empty_move_lists_are_cached():
+    cache = MoveCache(maxsize=4)
+    cache.put("blocked", [])
+    assert cache.get("blocked") == []
+    assert cache.hits == 1
+
+
+def test_lru_eviction():
+    cache = MoveCache(maxsize=2)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    cache.get("a")
+    cache.put("c", [3])
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.get("c") == [3]
+
+
+def test_new_turn_keeps_entries_and_resets_counters():
+    cache = MoveCache(maxsize=2)
+    cache.put("a", [1])
+    cache.get("a")
+    cache.new_turn()
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
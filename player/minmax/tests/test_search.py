@@ -0,0 +1,30 @@
+from   board                    import Coin
+from   geometry                 import Point
+from   player.minmax.search     import KILLER_SLOTS, SearchContext
+from   player.minmax.state      import Move
+
+
+def make_move(x):
+    return Move(Coin(Point(x, 0), 1), Point(x + 1, 0))
+
+
+def test_killers_keep_the_latest_distinct_moves_per_ply():
+    context = SearchContext(ordering=True)
+    a, b, c = make_move(0), make_move(1), make_move(2)
+    for move in (a, b, a, c):
+        context.record_cutoff(move, depth=2)
+    assert context.killers[0] == [c, a][:KILLER_SLOTS]
+    assert context.move_rank(c)[0] > context.move_rank(a)[0] > 0
+    assert context.move_rank(b)[0] == 0
+    # Killers are per ply; history is shared by all plies.
+    context.ply = 1
+    assert context.move_rank(c)[0] == 0
+    assert context.move_rank(a)[1] == 2 * 2**2
+
+
+def test_history_accumulates_squared_depth():
+    context = SearchContext(ordering=True)
+    move = make_move(0)
+    context.record_cutoff(move, depth=1)
+    context.record_cutoff(move, depth=3)
+    assert context.history[SearchContext.history_key(move)] == 1 + 9
@@ -1,6 +1,7 @@
 import pytest
 
 from   board                    import Coin
+from   board.topology           import OFF_BOARD
 from   geometry                 import Point
 from   player                   import GreedyPlayer
 from   player.minmax.state      import GameStateWrapper, Move
@@ -56,6 +57,19 @@ def test_get_destination_and_source(wrapper):
     assert isinstance(src, Point)
 
 
+def test_missing_corner_raises(hex_wrapper, monkeypatch):
+    coin = hex_wrapper.game.get_all_coins()[0]
+    topology = hex_wrapper.game.board.topology
+    for table in ("destination_corner", "source_corner"):
+        corners = list(getattr(topology, table))
+        corners[coin.region] = OFF_BOARD
+        monkeypatch.setattr(topology, table, corners)
+    with pytest.raises(ValueError):
+        hex_wrapper.get_destination(coin)
+    with pytest.raises(ValueError):
+        hex_wrapper.get_source(coin)
+
+
 def test_isolated_coin_penalty(wrapper):
     coin = wrapper.game.get_all_coins()[0]
     penalty = wrapper.isolated_coin_penalty(coin)
@@ -65,3 +79,110 @@ def test_isolated_coin_penalty(wrapper):
 def test_evaluate(wrapper):
     score = wrapper.evaluate()
     assert isinstance(score, (int, float))
+
+
+def test_make_and_unmake_move(wrapper):
+    before = set(wrapper.game.get_all_coins())
+    move = wrapper.get_legal_moves()[0]
+    wrapper.make_move(move)
+    assert wrapper.game.current_player_index == 1
+    assert wrapper.game.get_coin(move.dst) == Coin(move.dst, move.coin.region)
+    wrapper.unmake_move()
+    assert wrapper.game.current_player_index == 0
+    assert set(wrapper.game.get_all_coins()) == before
+    assert wrapper.get_legal_moves()[0] == move
+
+
+def test_move_cache_is_shared_and_keyed_by_position(wrapper):
+    coin = wrapper.game.get_all_coins()[0]
+    moves = wrapper.get_legal_moves_for_coin(coin)
+    assert wrapper.get_legal_moves_for_coin(coin) is moves
+    child = wrapper.apply_move(moves[0][0])
+    assert child.move_cache is wrapper.move_cache
+    # Same coin, different position: recomputed rather than served stale.
+    other = wrapper.game.get_all_coins()[1]
+    before = wrapper.get_legal_moves_for_coin(other)
+    wrapper.make_move(moves[0][0])
+    assert wrapper.get_legal_moves_for_coin(other) is not before
+    wrapper.unmake_move()
+    assert wrapper.get_legal_moves_for_coin(coin) is moves
+
+
+@pytest.fixture
+def hex_wrapper(make_wrapper):
+    return make_wrapper()
+
+
+@pytest.fixture
+def reachable_calls(monkeypatch):
+    calls = []
+    reachable = BoardState.reachable
+
+    def counting_reachable(self, coin):
+        calls.append(coin)
+        return reachable(self, coin)
+
+    monkeypatch.setattr(BoardState, "reachable", counting_reachable)
+    return calls
+
+
+def test_is_terminal_does_not_generate_moves_twice(hex_wrapper, reachable_calls):
+    calls = reachable_calls
+    assert not hex_wrapper.is_terminal()
+    assert len(calls) < len(hex_wrapper.game.coins_of())
+    hex_wrapper.get_legal_moves()
+    assert sorted(calls, key=lambda c: tuple(c.point)) == sorted(
+        hex_wrapper.game.coins_of(), key=lambda c: tuple(c.point)
+    )
+
+
+def test_get_legal_moves_limit_matches_full_sort(hex_wrapper):
+    moves = hex_wrapper.get_legal_moves()
+    for limit in (0, 1, 5, len(moves) + 1):
+        assert hex_wrapper.get_legal_moves(limit) == moves[:limit]
+
+
+def test_generate_moves_stages(hex_wrapper, reachable_calls):
+    top = GameStateWrapper(hex_wrapper.game, None).get_legal_moves(5)
+    preferred = top[3]
+    reachable_calls.clear()
+    moves = hex_wrapper.generate_moves(5, (None, preferred, preferred))
+    # The preferred move only needs its own coin's moves.
+    assert next(moves) == preferred
+    assert reachable_calls == [preferred.coin]
+    assert list(moves) == [m for m in top if m != preferred]
+
+    illegal = Move(preferred.coin, preferred.coin.point)
+    assert list(hex_wrapper.generate_moves(5, (illegal,))) == top
+
+
+def test_hops_to_goal(hex_wrapper):
+    topology = hex_wrapper.game.board.topology
+    for coin in hex_wrapper.game.get_all_coins():
+        hops = hex_wrapper.hops_to_goal(coin)
+        destination = hex_wrapper.get_destination(coin)
+        assert 0 < hops <= topology.distance(
+            topology.index[coin.point], topology.index[destination]
+        )
+
+
+def test_generate_moves_ranks_within_the_top_k(hex_wrapper):
+    top = hex_wrapper.get_legal_moves(5)
+    favourite = top[-1]
+    ranked = list(hex_wrapper.generate_moves(5, (top[2],), lambda m: m == favourite))
+    assert ranked[:2] == [top[2], favourite]
+    assert ranked[2:] == [m for m in top if m not in (top[2], favourite)]
+
+
+@pytest.mark.parametrize("min_progress", [1, 2, 3])
+def test_noisy_moves_advance_their_coin(hex_wrapper, min_progress):
+    board_state = hex_wrapper.game.board_state
+    metrics, topology = board_state.board.metrics, board_state.topology
+    noisy = hex_wrapper.get_noisy_moves(min_progress, None)
+    assert noisy == [m for m in hex_wrapper.get_legal_moves() if m in noisy]
+    for move in noisy:
+        corner = topology.destination_corner[move.coin.region]
+        before = metrics.cell_distance(topology.index[move.coin.point], corner)
+        after = metrics.cell_distance(topology.index[move.dst], corner)
+        assert before - after >= min_progress
+    assert hex_wrapper.get_noisy_moves(min_progress, 2) == noisy[:2]
@@ -0,0 +1,46 @@
+from   player.minmax.transposition \
+                                import Bound, ENTRY_BYTES, TranspositionTable
+
+
+def test_size_is_derived_from_memory_budget():
+    table = TranspositionTable(size_mb=1)
+    assert table.buckets == 2**20 // (2 * ENTRY_BYTES)
+    assert len(table.slots) == 2 * table.buckets
+    assert TranspositionTable(size_mb=0.0001).buckets == 1
+
+
+def test_store_and_probe():
+    table = TranspositionTable(size_mb=1)
+    assert table.probe(42) is None
+    table.store(42, 3, 1.5, Bound.EXACT, None)
+    entry = table.probe(42)
+    assert entry is not None
+    assert (entry.depth, entry.score, entry.bound) == (3, 1.5, Bound.EXACT)
+    assert len(table) == 1
+    table.clear()
+    assert table.probe(42) is None
+
+
+def test_depth_preferred_and_always_replace_slots():
+    table = TranspositionTable(size_mb=0.0001)  # a single bucket
+    table.store(1, 5, 0, Bound.EXACT, None)
+    table.store(2, 2, 0, Bound.EXACT, None)
+    # The shallower entry goes to the always-replace slot.
+    assert table.probe(1).depth == 5
+    assert table.probe(2).depth == 2
+    table.store(3, 1, 0, Bound.EXACT, None)
+    assert table.probe(1) is not None
+    assert table.probe(2) is None
+    # A deeper entry takes the depth-preferred slot and demotes the old one.
+    table.store(4, 6, 0, Bound.LOWER, None)
+    assert table.probe(4).depth == 6
+    assert table.probe(1).depth == 5
+
+
+def test_new_search_ages_depth_preferred_slot():
+    table = TranspositionTable(size_mb=0.0001)
+    table.store(1, 9, 0, Bound.EXACT, None)
+    table.new_search()
+    table.store(2, 1, 0, Bound.UPPER, None)
+    assert table.slots[0].key == 2
+    assert table.probe(1) is not None
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from   player.minmax            import vectorized
+from   player.minmax.vectorized import VectorizedEvaluator
+
+CORPUS = [
+    (6, {0: [1], 1: [4]}),
+    (6, {0: [1, 3, 5], 1: [2, 4, 6]}),
+    (6, {i: [i + 1] for i in range(6)}),
+    (4, {0: [1], 1: [3]}),
+    (8, {0: [1, 2], 1: [5, 6]}),
+]
+
+
+def test_missing_numpy_is_reported(make_wrapper, monkeypatch):
+    monkeypatch.setattr(vectorized, "np", None)
+    wrapper = make_wrapper()
+    with pytest.raises(ImportError, match="requires NumPy"):
+        VectorizedEvaluator(wrapper.game.board_state, [1])
+
+
+@pytest.mark.parametrize("side_count, region_map", CORPUS)
+def test_scores_match_reference_evaluation(make_wrapper, side_count, region_map):
+    pytest.importorskip("numpy")
+    rng = random.Random(side_count)
+    for perspective in region_map:
+        wrapper = make_wrapper(side_count, region_map, perspective)
+        own_regions = region_map[perspective]
+        evaluator = VectorizedEvaluator(wrapper.game.board_state, own_regions)
+        for _ in range(60):
+            assert evaluator.score() == wrapper.full_evaluate()
+            moves = wrapper.get_legal_moves()
+            if not moves:
+                break
+            wrapper.make_move(rng.choice(moves))
+
+
+def test_wrapper_uses_a_copy_of_the_given_evaluator(make_wrapper):
+    pytest.importorskip("numpy")
+    wrapper = make_wrapper()
+    template = VectorizedEvaluator(wrapper.game.board_state, [1])
+    child = type(wrapper)(wrapper.game, wrapper.player, evaluator=template)
+    assert child.evaluator.board_state is child.game.board_state
+    child = child.apply_move(child.get_legal_moves()[0])
+    assert child.evaluate() == child.full_evaluate()
@@ -0,0 +1,85 @@
+from   enum                     import IntEnum
+from   typing                   import NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player.minmax.state import Move
+
+# Rough memory held by one occupied slot: the entry tuple plus its key, score
+# and generation objects (moves are shared with the search). Used only to turn
+# a megabyte budget into a slot count.
+ENTRY_BYTES = 192
+
+
+class Bound(IntEnum):
+    """How a stored score relates to the true minimax value of the position."""
+
+    EXACT = 0
+    LOWER = 1  # Search failed high: true value >= score.
+    UPPER = 2  # Search failed low: true value <= score.
+
+
+class TTEntry(NamedTuple):
+    key: int
+    depth: int
+    score: float
+    bound: Bound
+    move: Optional["Move"]
+    generation: int
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table keyed by 64-bit position hashes.
+
+    Each bucket holds two slots: a depth-preferred slot, which keeps the deepest
+    result (entries from earlier searches are always replaceable), and an
+    always-replace slot that takes everything the first slot rejects.
+    """
+
+    def __init__(self, size_mb: float = 16) -> None:
+        self.buckets = max(1, int(size_mb * 2**20) // (2 * ENTRY_BYTES))
+        self.slots: list[Optional[TTEntry]] = [None] * (2 * self.buckets)
+        self.generation = 0
+
+    def new_search(self) -> None:
+        """Marks all current entries as stale so new results may replace them."""
+        self.generation += 1
+
+    def clear(self) -> None:
+        self.slots = [None] * (2 * self.buckets)
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """Returns the stored entry for `key`, if any."""
+        index = 2 * (key % self.buckets)
+        for entry in (self.slots[index], self.slots[index + 1]):
+            if entry is not None and entry.key == key:
+                return entry
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: float,
+        bound: Bound,
+        move: Optional["Move"],
+    ) -> None:
+        """Records a search result, applying the depth-preferred/always-replace policy."""
+        index = 2 * (key % self.buckets)
+        entry = TTEntry(key, depth, score, bound, move, self.generation)
+        preferred = self.slots[index]
+        if (
+            preferred is None
+            or preferred.key == key
+            or preferred.generation != self.generation
+            or depth >= preferred.depth
+        ):
+            if preferred is not None and preferred.key != key:
+                # Demote the displaced entry rather than dropping it outright.
+                self.slots[index + 1] = preferred
+            self.slots[index] = entry
+        else:
+            self.slots[index + 1] = entry
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self.slots)
@@ -0,0 +1,79 @@
+from   typing                   import Iterable
+
+from   player.minmax.evaluation import (Evaluator, behind_limits,
+                                        isolation_penalty)
+from   state                    import BoardState
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only this evaluator needs it.
+    np = None
+
+
+def require_numpy() -> None:
+    """Raises an informative ImportError when NumPy is not installed."""
+    if np is None:
+        raise ImportError(
+            "VectorizedEvaluator requires NumPy; install it with "
+            "`pip install numpy` or use the default evaluator."
+        )
+
+
+class VectorizedEvaluator(Evaluator):
+    """
+    Computes GameStateWrapper's evaluation with NumPy over all coins at once.
+
+    The occupied cells and their regions are gathered from the board's occupancy
+    array, and the distance term and the left-behind test are evaluated as array
+    operations against the layout's distance matrix and per-region corner
+    tables. Only the isolation penalties of own coins left behind still need a
+    move search each. Scores are identical to `GameStateWrapper.full_evaluate`.
+
+    It is stateless between positions, so `move`/`unmake` are no-ops and it can
+    stand in for the IncrementalEvaluator of a GameStateWrapper. Requires NumPy.
+    """
+
+    def __init__(self, board_state: BoardState, own_regions: Iterable[int]) -> None:
+        require_numpy()
+        self.board_state = board_state
+        self.own_regions = frozenset(own_regions)
+        topology, metrics = board_state.topology, board_state.board.metrics
+        self.distances = np.frombuffer(metrics.distances, dtype=np.uint8).reshape(
+            topology.size, topology.size
+        )
+        self.destination = np.array(topology.destination_corner, dtype=np.intp)
+        self.behind_limit = np.array(behind_limits(board_state), dtype=np.float64)
+        self.own_mask = np.zeros(len(topology.destination_corner), dtype=bool)
+        self.own_mask[list(self.own_regions)] = True
+
+    def move(self, src: int, dst: int, region: int) -> None:
+        """Nothing to track: every score is computed from the board."""
+        pass
+
+    def unmake(self) -> None:
+        """Nothing to restore: every score is computed from the board."""
+        pass
+
+    def score(self) -> int:
+        """Returns the evaluation of the current position."""
+        board_state = self.board_state
+        occupancy = np.array(board_state.occupancy, dtype=np.intp)
+        cells = np.flatnonzero(occupancy)
+        regions = occupancy[cells]
+        remaining = self.distances[cells, self.destination[regions]].astype(np.int64)
+        own = self.own_mask[regions]
+        score = int(np.where(own, -remaining, remaining).sum())
+
+        behind = own & (remaining > self.behind_limit[regions])
+        points = board_state.topology.points
+        for cell in cells[behind].tolist():
+            coin = board_state.point_coin_map[points[cell]]
+            score += isolation_penalty(board_state, coin, board_state.reachable(coin))
+        return score
+
+    def copy(self, board_state: BoardState) -> "VectorizedEvaluator":
+        """Returns an evaluator for `board_state`, sharing this one's tables."""
+        clone = object.__new__(VectorizedEvaluator)
+        clone.__dict__.update(self.__dict__)
+        clone.board_state = board_state
+        return clone
@@ -1,9 +1,13 @@
 
+import time
+
 import pytest
 
 from   board                    import Coin
 from   geometry                 import Point
 from   player                   import GreedyPlayer, MinMaxPlayer
+from   player.minmax.search     import SearchContext, SearchTimeout
+from   player.minmax.state      import GameStateWrapper
 from   state                    import BoardState, GameState
 from   state.tests.test_board_state \
                                 import DummyBoard
@@ -29,6 +33,22 @@ def dummy_game_manager():
     return DummyGameManager(game_state, players)
 
 
+@pytest.fixture
+def two_player_game_manager(make_game_state):
+    players = [MinMaxPlayer(0), MinMaxPlayer(1)]
+    return DummyGameManager(make_game_state(players=players), players)
+
+
+def compute_as_current_player(game, player):
+    # minimax_ab tells max nodes by player identity: seat `player` in the game.
+    players, index = game.game_state.players, game.current_player_index
+    seated, players[index] = players[index], player
+    try:
+        return player.compute_move(game)
+    finally:
+        players[index] = seated
+
+
 def test_greedy_player_compute_move(dummy_game_manager):
     player = GreedyPlayer(0)
     coin, dst = player.compute_move(dummy_game_manager)
@@ -43,3 +63,220 @@ def test_minmax_player_compute_move(dummy_game_manager):
     assert isinstance(coin, Coin)
     assert isinstance(dst, Point)
     assert dst in [Point(1, 0), Point(0, 1)]
+
+
+@pytest.mark.parametrize("depth, top_k", [(1, 5), (2, 4), (3, 3)])
+def test_in_place_search_matches_copy_search(two_player_game_manager, depth, top_k):
+    game = two_player_game_manager
+    for _ in range(3):
+        player = game.current_player()
+        in_place = MinMaxPlayer(player.player_id, depth, top_k, in_place=True)
+        copying = MinMaxPlayer(player.player_id, depth, top_k, in_place=False)
+        coins_before = set(game.get_all_coins())
+        move = compute_as_current_player(game, in_place)
+        assert move == compute_as_current_player(game, copying)
+        assert in_place.search_stats.cutoffs > 0 or depth == 1
+        assert set(game.get_all_coins()) == coins_before
+        game.board_state.move_coin(move[0].point, move[1])
+        game.next_turn()
+
+
+def test_transposition_table_keeps_best_move(two_player_game_manager):
+    game = two_player_game_manager
+    with_table = MinMaxPlayer(0, depth=3, top_k=4)
+    without_table = MinMaxPlayer(0, depth=3, top_k=4, tt_size_mb=0)
+    assert compute_as_current_player(game, with_table) == (
+        compute_as_current_player(game, without_table)
+    )
+    stats = with_table.search_stats
+    assert stats.tt_probes > 0
+    assert stats.tt_hits >= stats.tt_cutoffs
+    assert stats.nodes <= without_table.search_stats.nodes
+    assert without_table.search_stats.tt_probes == 0
+
+
+def test_move_cache_stays_bounded_over_a_game(two_player_game_manager):
+    game = two_player_game_manager
+    players = [MinMaxPlayer(i, depth=2, top_k=3, move_cache_size=64) for i in (0, 1)]
+    for _ in range(6):
+        player = players[game.current_player().player_id]
+        coin, dst = player.compute_move(game)
+        assert len(player.move_cache) <= 64
+        assert player.search_stats.move_cache_hits == player.move_cache.hits
+        game.board_state.move_coin(coin.point, dst)
+        game.next_turn()
+
+
+def test_time_limited_search_respects_budget(two_player_game_manager, monkeypatch):
+    game = two_player_game_manager
+    coins_before = set(game.get_all_coins())
+    timeouts = []
+    check_time = SearchContext.check_time
+
+    def recording_check_time(self):
+        try:
+            check_time(self)
+        except SearchTimeout:
+            timeouts.append(self.deadline)
+            raise
+
+    monkeypatch.setattr(SearchContext, "check_time", recording_check_time)
+    player = MinMaxPlayer(0, time_limit=0.2)
+    start = time.monotonic()
+    coin, dst = compute_as_current_player(game, player)
+    # The search is cut off by the deadline check, not by running out of depth;
+    # the wall-clock bound only guards against hangs.
+    assert len(timeouts) == 1
+    assert time.monotonic() - start < 0.2 + 2
+    assert dst in game.valid_moves(coin)
+    assert player.search_stats.completed_depth >= 1
+    assert set(game.get_all_coins()) == coins_before
+
+
+def test_time_limited_search_always_has_a_move(two_player_game_manager):
+    game = two_player_game_manager
+    player = MinMaxPlayer(0, time_limit=1e-9)
+    coin, dst = compute_as_current_player(game, player)
+    assert dst in game.valid_moves(coin)
+    assert player.search_stats.completed_depth == 0
+
+
+def test_iterative_deepening_stops_at_max_depth(two_player_game_manager):
+    game = two_player_game_manager
+    player = MinMaxPlayer(0, top_k=3, time_limit=60, max_depth=2)
+    coin, dst = compute_as_current_player(game, player)
+    assert player.search_stats.completed_depth == 2
+    assert dst in game.valid_moves(coin)
+
+
+def test_vectorized_evaluation_picks_the_same_move(two_player_game_manager):
+    pytest.importorskip("numpy")
+    game = two_player_game_manager
+    reference = MinMaxPlayer(0, depth=3, top_k=4)
+    vectorized = MinMaxPlayer(0, depth=3, top_k=4, vectorized_eval=True)
+    assert compute_as_current_player(game, vectorized) == (
+        compute_as_current_player(game, reference)
+    )
+    assert vectorized.search_stats.cutoffs > 0
+
+
+def search_root(game, depth, top_k, **options):
+    # Maximize for the game's own player object, as during play.
+    player = game.current_player()
+    root = GameStateWrapper(game.game_state, player)
+    context = SearchContext(in_place=True, **options)
+    value, move = MinMaxPlayer.minimax_ab(
+        root, depth, top_k, len(game.players), player, context=context
+    )
+    return value, move, context.stats
+
+
+@pytest.mark.parametrize("depth", [2, 3, 4])
+def test_pvs_finds_the_same_value(two_player_game_manager, depth):
+    game = two_player_game_manager
+    results = {pvs: search_root(game, depth, 4, pvs=pvs) for pvs in (False, True)}
+    assert results[True][:2] == results[False][:2]
+    assert results[True][2].null_window_searches > 0
+    assert results[False][2].null_window_searches == 0
+
+
+@pytest.mark.parametrize("depth", [3, 4, 5])
+def test_killer_and_history_ordering_keeps_the_value(two_player_game_manager, depth):
+    game = two_player_game_manager
+    static = search_root(game, depth, 5)
+    ordered = search_root(game, depth, 5, ordering=True)
+    assert ordered[0] == static[0]
+    assert ordered[2].cutoffs > 0 and ordered[2].killer_cutoffs > 0
+    assert ordered[2].nodes <= static[2].nodes
+
+
+def test_pvs_falls_back_to_paranoid_search_for_more_players(make_game_state):
+    players = [MinMaxPlayer(i, depth=2, top_k=3, pvs=True) for i in range(3)]
+    region_map = {0: [1], 1: [3], 2: [5]}
+    game_state = make_game_state(region_map=region_map, players=players)
+    game = DummyGameManager(game_state, players)
+    coin, dst = players[0].compute_move(game)
+    assert dst in game.valid_moves(coin)
+    assert players[0].search_stats.null_window_searches == 0
+
+
+def test_aspiration_search_recovers_the_exact_score(two_player_game_manager):
+    game = two_player_game_manager
+    exact, _, _ = search_root(game, 3, 4)
+    player = game.current_player()
+    player.aspiration_window = 1
+    player.table = None
+    root = GameStateWrapper(game.game_state, player)
+    for guess in (exact - 10, exact, exact + 10):
+        context = SearchContext(in_place=True)
+        value, move = player.aspiration_search(root, 3, 2, context, guess)
+        assert value == exact and move is not None
+        assert context.stats.aspiration_searches == 1
+        assert (context.stats.aspiration_researches > 0) == (guess != exact)
+
+
+def test_time_limited_search_with_aspiration_windows(two_player_game_manager):
+    game = two_player_game_manager
+    player = game.current_player()
+    player.time_limit, player.max_depth, player.aspiration_window = 60, 3, 2
+    coin, dst = player.compute_move(game)
+    assert dst in game.valid_moves(coin)
+    assert player.search_stats.aspiration_searches == 2
+
+
+def test_quiescence_extends_horizon_nodes(two_player_game_manager):
+    game = two_player_game_manager
+    plain = search_root(game, 2, 4)
+    assert plain[2].quiescence_nodes == 0
+    assert search_root(game, 2, 4, quiescence_depth=0)[:2] == plain[:2]
+    _, move, stats = search_root(game, 2, 4, quiescence_depth=2)
+    root = GameStateWrapper(game.game_state, game.current_player())
+    assert root.is_legal_move(move)
+    assert stats.quiescence_nodes > 0
+
+
+def test_minmax_player_with_quiescence(two_player_game_manager):
+    game = two_player_game_manager
+    player = game.current_player()
+    player.depth, player.quiescence_depth = 2, 2
+    coin, dst = player.compute_move(game)
+    assert dst in game.valid_moves(coin)
+    assert player.search_stats.quiescence_nodes > 0
+
+
+def test_late_move_reductions(two_player_game_manager):
+    game = two_player_game_manager
+    shallow = search_root(game, 2, 5, lmr=True)
+    assert shallow[:2] == search_root(game, 2, 5)[:2]
+    assert shallow[2].lmr_reductions == 0
+    _, move, stats = search_root(game, 4, 5, lmr=True)
+    root = GameStateWrapper(game.game_state, game.current_player())
+    assert root.is_legal_move(move)
+    assert stats.lmr_reductions > 0
+
+
+def test_futility_pruning_keeps_the_result(two_player_game_manager):
+    game = two_player_game_manager
+    prunes = table_prunes = 0
+    for ply in range(16):
+        player_id = game.current_player().player_id
+        # Prunes need left-behind coins, so compare from the midgame on.
+        if ply >= 8:
+            for depth in (3, 5):
+                plain = search_root(game, depth, 5)
+                pruned = search_root(game, depth, 5, futility=True)
+                assert pruned[:2] == plain[:2]
+                assert pruned[2].nodes <= plain[2].nodes
+                prunes += pruned[2].futility_prunes
+            # Frontier nodes of even depths are min nodes, which are not pruned.
+            assert search_root(game, 4, 5, futility=True)[2].futility_prunes == 0
+            with_table = MinMaxPlayer(player_id, depth=3, futility=True)
+            move = compute_as_current_player(game, with_table)
+            plain_player = MinMaxPlayer(player_id, depth=3)
+            assert move == compute_as_current_player(game, plain_player)
+            table_prunes += with_table.search_stats.futility_prunes
+        else:
+            move = compute_as_current_player(game, MinMaxPlayer(player_id, depth=1))
+        game.board_state.move_coin(move[0].point, move[1])
+        game.next_turn()
+    assert prunes > 0 and table_prunes > 0
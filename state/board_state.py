@@ -1,22 +1,59 @@
 import copy
-from   typing                   import Iterable, Optional
+from   typing                   import Iterable, NamedTuple, Optional
 
 from   board                    import Coin
 from   board.layout             import LayoutInterface
+from   board.topology           import OFF_BOARD
 from   geometry                 import Point
 
 
+class Reachability(NamedTuple):
+    """Result of BoardState.reachable for one coin."""
+
+    moves: list[int]  # Legal destination cells.
+    parent: dict[int, int]  # Reached cell -> previous cell on its path.
+    expanded: set[int]  # Origin and jump landings, whose jumps were tried.
+
+
 class BoardState:
     """
     Encapsulates the current state of the board including coin positions and valid move logic.
+
+    Besides the point -> coin map, the state keeps an occupancy array indexed by
+    the layout's cell ids (region of the coin on the cell, 0 when empty) so move
+    generation can run on integers. The layout itself is treated as immutable and
+    shared by reference between states and their copies.
+
+    `zobrist` is a Zobrist hash of the coin placement, updated incrementally by
+    every placement/removal (see Topology.zobrist_keys), `region_cells` indexes
+    the occupied cells of each region and `home_counts` counts, per region, the
+    coins already inside their destination region.
     """
 
     def __init__(self, board: LayoutInterface, coins: Iterable[Coin]) -> None:
-        self.board = copy.deepcopy(board)
+        self.board = board
+        self.topology = self.board.topology
         self.point_coin_map: dict[Point, Coin] = {}
+        self.occupancy: list[int] = [0] * len(self.topology)
+        self.undo_stack: list[tuple[Point, Point]] = []
+        self.zobrist = 0
+        self.region_cells: dict[int, set[int]] = {}
+        self.home_counts: list[int] = [0] * len(self.topology.goal_mask)
         for coin in coins:
             self.set_coin(coin)
 
+    def copy(self) -> "BoardState":
+        """Returns an independent copy of the coin placement sharing the same layout."""
+        clone = copy.copy(self)
+        clone.point_coin_map = dict(self.point_coin_map)
+        clone.occupancy = list(self.occupancy)
+        clone.undo_stack = list(self.undo_stack)
+        clone.home_counts = list(self.home_counts)
+        clone.region_cells = {
+            region: set(cells) for region, cells in self.region_cells.items()
+        }
+        return clone
+
     def get_all_points(self) -> list[Point]:
         """Returns all valid points on the board."""
         return list(self.board)
@@ -25,6 +62,14 @@ class BoardState:
         """Returns a list of all coins currently on the board."""
         return list(self.point_coin_map.values())
 
+    def coins_of_region(self, region: int) -> list[Coin]:
+        """Returns the coins of one region, without scanning the whole board."""
+        points = self.topology.points
+        return [
+            self.point_coin_map[points[cell]]
+            for cell in self.region_cells.get(region, ())
+        ]
+
     def has_coin(self, point: Point) -> bool:
         """True if there is a coin at the given point."""
         return point in self.point_coin_map
@@ -35,12 +80,29 @@ class BoardState:
 
     def set_coin(self, coin: Coin) -> None:
         """Places a coin at its point on the board."""
-        assert coin.point in self.board, f"Invalid coin location: {coin.point}"
+        cell = self.topology.cell_of(coin.point)
+        assert cell != OFF_BOARD, f"Invalid coin location: {coin.point}"
+        zobrist_keys, goal_mask = self.topology.zobrist_keys, self.topology.goal_mask
+        if previous := self.occupancy[cell]:
+            self.zobrist ^= zobrist_keys[previous][cell]
+            self.region_cells[previous].discard(cell)
+            self.home_counts[previous] -= goal_mask[previous][cell]
+        region = coin.region
         self.point_coin_map[coin.point] = coin
+        self.occupancy[cell] = region
+        self.zobrist ^= zobrist_keys[region][cell]
+        self.region_cells.setdefault(region, set()).add(cell)
+        self.home_counts[region] += goal_mask[region][cell]
 
     def remove_coin_at(self, point: Point) -> Coin:
         """Removes and returns the coin at the given point."""
         assert point in self.point_coin_map, f"No coin at: {point}"
+        cell = self.topology.index[point]
+        region = self.occupancy[cell]
+        self.zobrist ^= self.topology.zobrist_keys[region][cell]
+        self.region_cells[region].discard(cell)
+        self.home_counts[region] -= self.topology.goal_mask[region][cell]
+        self.occupancy[cell] = 0
         return self.point_coin_map.pop(point)
 
     def move_coin(self, src: Point, dst: Point) -> None:
@@ -48,65 +110,70 @@ class BoardState:
         coin = self.remove_coin_at(src)
         self.set_coin(Coin(dst, coin.region))
 
-    def children(self, coin: Coin, cur: Point) -> list[tuple[Point, bool]]:
-        """
-        Computes all valid adjacent or jump moves from the current point for a given coin.
+    def make_move(self, src: Point, dst: Point) -> None:
+        """Moves a coin from src to dst in place and records the move for undoing."""
+        self.move_coin(src, dst)
+        self.undo_stack.append((src, dst))
 
-        Returns:
-            List of (next_point, is_jump) pairs.
-        """
-        children: list[tuple[Point, bool]] = []
-        for delta in self.board.directions:
-            step = cur + delta
-            if not self.get_coin(step):
-                if self.board.can_enter(coin, step):
-                    children.append((step, False))
-            else:
-                jump = step + delta
-                if not self.get_coin(jump) and self.board.can_enter(coin, jump, True):
-                    children.append((jump, True))
-        return children
+    def unmake_move(self) -> tuple[Point, Point]:
+        """Reverts the most recent make_move and returns its (src, dst) pair."""
+        src, dst = self.undo_stack.pop()
+        self.move_coin(dst, src)
+        return src, dst
 
-    def valid_moves(self, coin: Coin) -> set[Point]:
+    def reachable(self, coin: Coin) -> Reachability:
         """
-        Computes all valid moves for the given coin using DFS with jump chaining.
+        Computes every cell the coin can end its move on, in a single pass.
+
+        Immediate steps are collected first; jump chains are then explored
+        breadth-first, expanding each landing cell exactly once. The coin stays on
+        its origin cell throughout, as it does while the move is being decided.
 
         Returns:
-            Set of all reachable positions.
+            Reachability with the legal destination cells, a parent map over
+            every reached cell (for path reconstruction) and the cells whose
+            jumps were explored.
         """
-        parent = self.valid_moves_helper(coin)
-        return {point for point in parent if self.board.can_enter(coin, point)}
+        topology = self.topology
+        occupancy = self.occupancy
+        jumps = topology.jumps
+        step_entry = topology.step_entry[coin.region]
+        jump_entry = topology.jump_entry[coin.region]
+        origin = topology.index[coin.point]
+
+        parent: dict[int, int] = {}
+        for step, _ in jumps[origin]:
+            if step != OFF_BOARD and not occupancy[step] and step_entry[step]:
+                parent[step] = origin
+
+        frontier = [origin]
+        expanded = {origin}
+        for cur in frontier:
+            for over, landing in jumps[cur]:
+                if (
+                    landing == OFF_BOARD
+                    or landing in expanded
+                    or not occupancy[over]
+                    or occupancy[landing]
+                    or not jump_entry[landing]
+                ):
+                    continue
+                expanded.add(landing)
+                frontier.append(landing)
+                parent.setdefault(landing, cur)
+
+        moves = [cell for cell in parent if step_entry[cell]]
+        return Reachability(moves, parent, expanded)
 
-    def valid_moves_helper(self, coin: Coin) -> dict[Point, Point]:
+    def valid_moves(self, coin: Coin) -> set[Point]:
         """
-        Computes all reachable positions for the given coin using DFS with jump chaining.
+        Computes all valid moves for the given coin, including chained jumps.
 
         Returns:
-            Dict of all reachable positions mapped to their previous positions.
+            Set of all reachable positions.
         """
-        dfs_stack = [coin.point]
-        visited: set[Point] = set()
-        finished: set[Point] = set()
-        parent: dict[Point, Point] = {}
-        while dfs_stack:
-            cur = dfs_stack[-1]
-            if cur in visited:
-                dfs_stack.pop()
-                for nxt, is_jump in self.children(coin, cur):
-                    if is_jump and nxt in finished:
-                        parent[nxt] = cur
-                finished.add(cur)
-            else:
-                visited.add(cur)
-                for nxt, is_jump in self.children(coin, cur):
-                    if is_jump and nxt not in finished:
-                        dfs_stack.append(nxt)
-
-        # Add immediate non-jump steps
-        for nxt, is_jump in self.children(coin, coin.point):
-            if not is_jump:
-                parent[nxt] = cur
-        return parent
+        points = self.topology.points
+        return {points[cell] for cell in self.reachable(coin).moves}
 
     def steps(self, coin: Coin, point: Optional[Point]) -> list[Point]:
         """
@@ -115,13 +182,20 @@ class BoardState:
         Returns:
             Ordered path of moves.
         """
-        parent = self.valid_moves_helper(coin)
+        parent = self.reachable(coin).parent
+        points = self.topology.points
+        cell = None if point is None else self.topology.index.get(point)
         path: list[Point] = []
-        while point:
-            path.append(point)
-            point = parent.get(point)
+        while cell is not None:
+            path.append(points[cell])
+            cell = parent.get(cell)
         return path[::-1]
 
     def coin_at_destination(self, coin: Coin) -> bool:
         """Checks if coin has reached its destination region/color"""
-        return self.board.region(coin.point) == self.board.opposite_region(coin.region)
+        cell = self.topology.cell_of(coin.point)
+        return cell != OFF_BOARD and self.topology.goal_mask[coin.region][cell]
+
+    def region_at_destination(self, region: int) -> bool:
+        """True if every coin of the region sits in its destination region (O(1))."""
+        return self.home_counts[region] == len(self.region_cells.get(region, ()))
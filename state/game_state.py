@@ -45,10 +45,36 @@ class GameState:
         player = player or self.current_player()
         return coin.region in self.player_id_region_map[player.player_id]
 
+    def position_key(self) -> int:
+        """
+        Returns a 64-bit Zobrist key identifying the coin placement together with
+        the side to move.
+        """
+        board_state = self.board_state
+        return board_state.zobrist ^ board_state.topology.side_keys[
+            self.current_player_index
+        ]
+
+    def coins_of(self, player: Optional["Player"] = None) -> list[Coin]:
+        """
+        Returns the coins of the given (default: current) player, read from the
+        board's per-region index.
+        """
+        player = player or self.current_player()
+        return [
+            coin
+            for region in self.player_id_region_map[player.player_id]
+            for coin in self.board_state.coins_of_region(region)
+        ]
+
     def next_turn(self) -> None:
         """Advances the turn to the next player."""
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
 
+    def previous_turn(self) -> None:
+        """Rewinds the turn to the previous player."""
+        self.current_player_index = (self.current_player_index - 1) % len(self.players)
+
     def has_current_player_won(self) -> bool:
         """
         Checks whether the current player has won.
@@ -56,7 +82,6 @@ class GameState:
         """
         player_id = self.current_player().player_id
         return all(
-            self.board_state.coin_at_destination(coin)
-            for coin in self.board_state.get_all_coins()
-            if coin.region in self.player_id_region_map[player_id]
+            self.board_state.region_at_destination(region)
+            for region in self.player_id_region_map[player_id]
         )
@@ -0,0 +1,53 @@
+"""
+The jump DFS that BoardState used before the single-pass reachable(), kept as a
+reference for the tests that check the two agree and for the reachability
+benchmark.
+"""
+
+from   board                    import Coin
+from   board.topology           import OFF_BOARD
+from   state                    import BoardState
+
+
+def legacy_children(
+    board_state: BoardState, region: int, cell: int
+) -> list[tuple[int, bool]]:
+    topology, occupancy = board_state.topology, board_state.occupancy
+    step_entry = topology.step_entry[region]
+    jump_entry = topology.jump_entry[region]
+    result = []
+    for step, jump in topology.jumps[cell]:
+        if step == OFF_BOARD:
+            continue
+        if not occupancy[step]:
+            if step_entry[step]:
+                result.append((step, False))
+        elif jump != OFF_BOARD and not occupancy[jump] and jump_entry[jump]:
+            result.append((jump, True))
+    return result
+
+
+def legacy_valid_moves(board_state: BoardState, coin: Coin) -> set[int]:
+    """The DFS that valid_moves/valid_moves_helper used before reachable()."""
+    region = coin.region
+    origin = board_state.topology.index[coin.point]
+    dfs_stack, visited, finished = [origin], set(), set()
+    parent: dict[int, int] = {}
+    while dfs_stack:
+        cur = dfs_stack[-1]
+        if cur in visited:
+            dfs_stack.pop()
+            for nxt, is_jump in legacy_children(board_state, region, cur):
+                if is_jump and nxt in finished:
+                    parent[nxt] = cur
+            finished.add(cur)
+        else:
+            visited.add(cur)
+            for nxt, is_jump in legacy_children(board_state, region, cur):
+                if is_jump and nxt not in finished:
+                    dfs_stack.append(nxt)
+    for nxt, is_jump in legacy_children(board_state, region, origin):
+        if not is_jump:
+            parent[nxt] = origin
+    step_entry = board_state.topology.step_entry[region]
+    return {cell for cell in parent if step_entry[cell]}
@@ -1,9 +1,15 @@
+import functools
+import operator
+import random
+
 import pytest
 
-from   board                    import Coin
+from   board                    import Coin, get_layout
 from   board.layout             import LayoutInterface
 from   geometry                 import Point
 from   state.board_state        import BoardState
+from   state.tests.legacy_reachability \
+                                import legacy_valid_moves
 
 
 class DummyBoard(LayoutInterface):
@@ -122,3 +128,175 @@ def test_board_state_integration(dummy_board_and_coins):
     assert set(board_state.get_all_coins()) == set(coins)
     for coin in coins:
         assert coin.point in board_state.board
+
+
+def test_make_and_unmake_move(dummy_board_and_coins):
+    board, coins = dummy_board_and_coins
+    board_state = BoardState(board, coins)
+    board_state.make_move(Point(0, 0), Point(1, 0))
+    assert board_state.get_coin(Point(1, 0)) == Coin(Point(1, 0), 1)
+    assert not board_state.has_coin(Point(0, 0))
+
+    assert board_state.unmake_move() == (Point(0, 0), Point(1, 0))
+    assert set(board_state.get_all_coins()) == set(coins)
+    assert board_state.undo_stack == []
+
+
+def test_copy_shares_layout_but_not_coins(dummy_board_and_coins):
+    board, coins = dummy_board_and_coins
+    board_state = BoardState(board, coins)
+    clone = board_state.copy()
+    assert clone.board is board_state.board is board
+    clone.move_coin(Point(0, 0), Point(1, 0))
+    assert board_state.has_coin(Point(0, 0))
+    assert not clone.has_coin(Point(0, 0))
+    assert board_state.occupancy != clone.occupancy
+
+
+def full_zobrist(board_state):
+    keys = board_state.topology.zobrist_keys
+    occupied = [
+        (cell, region) for cell, region in enumerate(board_state.occupancy) if region
+    ]
+    return functools.reduce(
+        operator.xor, (keys[region][cell] for cell, region in occupied), 0
+    )
+
+
+@pytest.fixture
+def hex_board_state(make_game_state):
+    return make_game_state(region_map={0: [1, 3, 5], 1: [2, 4, 6]}).board_state
+
+
+def test_zobrist_is_updated_incrementally(hex_board_state):
+    rng = random.Random(7)
+    assert hex_board_state.zobrist == full_zobrist(hex_board_state)
+    history = [hex_board_state.zobrist]
+    for _ in range(30):
+        movable = [
+            c for c in hex_board_state.get_all_coins() if hex_board_state.valid_moves(c)
+        ]
+        coin = rng.choice(movable)
+        dst = rng.choice(sorted(hex_board_state.valid_moves(coin), key=tuple))
+        hex_board_state.make_move(coin.point, dst)
+        assert hex_board_state.zobrist == full_zobrist(hex_board_state)
+        history.append(hex_board_state.zobrist)
+    for expected in reversed(history[:-1]):
+        hex_board_state.unmake_move()
+        assert hex_board_state.zobrist == expected
+
+
+def test_zobrist_identifies_transpositions(hex_board_state):
+    a, b = hex_board_state.copy(), hex_board_state.copy()
+    coins = sorted(
+        (c for c in a.get_all_coins() if a.valid_moves(c)), key=lambda c: tuple(c.point)
+    )
+    first, second = coins[0], coins[-1]
+    first_dst = sorted(a.valid_moves(first), key=tuple)[0]
+    second_dst = sorted(a.valid_moves(second), key=tuple)[0]
+
+    a.move_coin(first.point, first_dst)
+    a.move_coin(second.point, second_dst)
+    b.move_coin(second.point, second_dst)
+    b.move_coin(first.point, first_dst)
+    assert a.zobrist == b.zobrist != hex_board_state.zobrist
+
+
+def random_board_states():
+    rng = random.Random(0)
+    for side_count in (4, 6, 8):
+        layout = get_layout(side_count)
+        points = list(layout)
+        for density in (4, 2):
+            coins = [
+                Coin(point, rng.randint(1, side_count))
+                for point in rng.sample(points, len(points) // density)
+            ]
+            yield BoardState(layout, coins)
+
+
+def test_reachable_matches_legacy_dfs():
+    for board_state in random_board_states():
+        for coin in board_state.get_all_coins():
+            reach = board_state.reachable(coin)
+            assert set(reach.moves) == legacy_valid_moves(board_state, coin)
+
+
+def test_reachable_paths_are_legal_hops():
+    for board_state in random_board_states():
+        topology, occupancy = board_state.topology, board_state.occupancy
+        for coin in board_state.get_all_coins():
+            step_entry = topology.step_entry[coin.region]
+            jump_entry = topology.jump_entry[coin.region]
+            for cell in board_state.reachable(coin).moves:
+                path = board_state.steps(coin, topology.points[cell])
+                cells = [topology.index[point] for point in path]
+                assert cells[0] == topology.index[coin.point] and cells[-1] == cell
+                assert step_entry[cell]
+                if cells[1] in topology.neighbors[cells[0]]:
+                    # A step is a whole move.
+                    assert len(cells) == 2 and not occupancy[cell]
+                    continue
+                for src, dst in zip(cells, cells[1:]):
+                    over = next(o for o, l in topology.jumps[src] if l == dst)
+                    assert occupancy[over] and not occupancy[dst]
+                    assert jump_entry[dst]
+
+
+def test_region_index_tracks_moves(hex_board_state):
+    def scanned(region):
+        return {c for c in hex_board_state.get_all_coins() if c.region == region}
+
+    regions = hex_board_state.topology.coin_regions
+    assert all(set(hex_board_state.coins_of_region(r)) == scanned(r) for r in regions)
+    coin = next(
+        c for c in hex_board_state.coins_of_region(1) if hex_board_state.valid_moves(c)
+    )
+    dst = sorted(hex_board_state.valid_moves(coin), key=tuple)[0]
+    clone = hex_board_state.copy()
+    hex_board_state.make_move(coin.point, dst)
+    assert Coin(dst, 1) in hex_board_state.coins_of_region(1)
+    assert coin not in hex_board_state.coins_of_region(1)
+    assert coin in clone.coins_of_region(1)
+    hex_board_state.unmake_move()
+    assert all(set(hex_board_state.coins_of_region(r)) == scanned(r) for r in regions)
+    assert hex_board_state.coins_of_region(99) == []
+
+
+def test_home_counts_track_moves(hex_board_state):
+    def scanned(region):
+        coins = hex_board_state.coins_of_region(region)
+        return sum(hex_board_state.coin_at_destination(c) for c in coins)
+
+    regions = hex_board_state.topology.coin_regions
+    rng = random.Random(11)
+    for _ in range(30):
+        movable = [
+            c for c in hex_board_state.get_all_coins() if hex_board_state.valid_moves(c)
+        ]
+        coin = rng.choice(movable)
+        dst = rng.choice(sorted(hex_board_state.valid_moves(coin), key=tuple))
+        hex_board_state.make_move(coin.point, dst)
+        assert all(hex_board_state.home_counts[r] == scanned(r) for r in regions)
+    for _ in range(30):
+        hex_board_state.unmake_move()
+    assert all(hex_board_state.home_counts[r] == 0 for r in regions)
+
+
+def test_region_at_destination(hex_board_state):
+    topology = hex_board_state.topology
+    goal = topology.opposite[1]
+    assert not hex_board_state.region_at_destination(1)
+    for coin in hex_board_state.coins_of_region(goal):
+        hex_board_state.remove_coin_at(coin.point)
+    for coin in hex_board_state.coins_of_region(1):
+        hex_board_state.remove_coin_at(coin.point)
+    goal_points = [p for p, r in zip(topology.points, topology.regions) if r == goal]
+    clone = hex_board_state.copy()
+    for point in goal_points:
+        hex_board_state.set_coin(Coin(point, 1))
+    assert hex_board_state.region_at_destination(1)
+    assert clone.home_counts[1] == 0
+    hex_board_state.set_coin(Coin(goal_points[0], goal))
+    assert hex_board_state.region_at_destination(1)
+    assert hex_board_state.home_counts[1] == len(goal_points) - 1
@@ -49,15 +49,31 @@ def test_valid_moves(dummy_game_state):
 
 
 def test_has_current_player_won(dummy_game_state):
-    # Simulate all coins in opposite region for player 0
-    for coin in dummy_game_state.get_all_coins():
-        coin.region = 2
+    board_state = dummy_game_state.board_state
+    # Move player 0's only coin into its opposite region (odd x -> region 2)
+    board_state.move_coin(Point(0, 0), Point(1, 0))
     assert dummy_game_state.has_current_player_won()
     # Not all coins in opposite region
-    dummy_game_state.get_all_coins()[0].region = 1
+    board_state.set_coin(Coin(Point(0, 0), 1))
     assert not dummy_game_state.has_current_player_won()
 
 
 def test_player_id_region_map(dummy_game_state):
     assert dummy_game_state.player_id_region_map[0] == [1]
     assert dummy_game_state.player_id_region_map[1] == [2]
+
+
+def test_position_key_includes_side_to_move(dummy_game_state):
+    key = dummy_game_state.position_key()
+    dummy_game_state.next_turn()
+    assert dummy_game_state.position_key() != key
+    dummy_game_state.next_turn()
+    assert dummy_game_state.position_key() == key
+    dummy_game_state.board_state.move_coin(Point(0, 0), Point(1, 0))
+    assert dummy_game_state.position_key() != key
+
+
+def test_coins_of(dummy_game_state):
+    players = dummy_game_state.players
+    assert dummy_game_state.coins_of() == [Coin(Point(0, 0), 1)]
+    assert dummy_game_state.coins_of(players[1]) == [Coin(Point(1, 1), 2)]